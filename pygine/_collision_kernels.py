@@ -0,0 +1,111 @@
+"""
+Числовые ядра коллизий (под Numba)
+
+Чистая скалярная арифметика без объектов pygame: при установленной
+Numba функции компилируются в машинный код и обходят интерпретатор на
+каждой вершине; без неё остаются обычными функциями Python, а
+sprite.py использует свои векторные пути NumPy.
+"""
+
+import math
+
+import numpy as np
+
+HAS_NUMBA = False
+
+
+def sat_overlap(a, b):
+    """SAT для двух выпуклых четырёхугольников (4, 2).
+
+    Возвращает True при пересечении. Нормали не нормируются — для
+    разделяющей оси важен только знак перекрытия.
+    """
+    for poly in (a, b):
+        for i in range(4):
+            j = (i + 1) % 4
+            nx = poly[i, 1] - poly[j, 1]
+            ny = poly[j, 0] - poly[i, 0]
+
+            min_a = math.inf
+            max_a = -math.inf
+            min_b = math.inf
+            max_b = -math.inf
+            for k in range(4):
+                p = a[k, 0] * nx + a[k, 1] * ny
+                if p < min_a:
+                    min_a = p
+                if p > max_a:
+                    max_a = p
+                p = b[k, 0] * nx + b[k, 1] * ny
+                if p < min_b:
+                    min_b = p
+                if p > max_b:
+                    max_b = p
+
+            if max_a < min_b or max_b < min_a:
+                return False
+    return True
+
+
+def point_in_poly(px, py, poly):
+    """Точка внутри многоугольника (лучевой бросок), poly — (N, 2)."""
+    n = poly.shape[0]
+    inside = False
+    p1x = poly[0, 0]
+    p1y = poly[0, 1]
+    for i in range(1, n + 1):
+        p2x = poly[i % n, 0]
+        p2y = poly[i % n, 1]
+        if py > min(p1y, p2y):
+            if py <= max(p1y, p2y):
+                if px <= max(p1x, p2x):
+                    if p1y != p2y:
+                        xinters = (py - p1y) * (p2x - p1x) / (p2y - p1y) + p1x
+                        if p1x == p2x or px <= xinters:
+                            inside = not inside
+                    elif p1x == p2x or px <= max(p1x, p2x):
+                        inside = not inside
+        p1x = p2x
+        p1y = p2y
+    return inside
+
+
+def seg_dist2(px, py, x1, y1, x2, y2):
+    """Квадрат расстояния от точки до отрезка (без sqrt)."""
+    dx = x2 - x1
+    dy = y2 - y1
+    len_sq = dx * dx + dy * dy
+    if len_sq == 0.0:
+        ex = px - x1
+        ey = py - y1
+        return ex * ex + ey * ey
+    t = ((px - x1) * dx + (py - y1) * dy) / len_sq
+    if t < 0.0:
+        t = 0.0
+    elif t > 1.0:
+        t = 1.0
+    ex = px - (x1 + t * dx)
+    ey = py - (y1 + t * dy)
+    return ex * ex + ey * ey
+
+
+# При наличии Numba ядра компилируются и прогреваются сразу при импорте,
+# чтобы первая коллизия в игре не платила за JIT-компиляцию.
+try:
+    from numba import njit
+
+    sat_overlap = njit(cache=True, fastmath=True)(sat_overlap)
+    point_in_poly = njit(cache=True, fastmath=True)(point_in_poly)
+    seg_dist2 = njit(cache=True, fastmath=True)(seg_dist2)
+
+    _warm = np.zeros((4, 2), dtype=np.float32)
+    _warm[1:3, 0] = 1.0
+    _warm[2:4, 1] = 1.0
+    sat_overlap(_warm, _warm)
+    point_in_poly(0.5, 0.5, _warm)
+    seg_dist2(0.0, 0.0, 0.0, 0.0, 1.0, 1.0)
+    del _warm
+
+    HAS_NUMBA = True
+except ImportError:
+    pass
@@ -13,6 +13,9 @@ class Camera:
     def __init__(self, width: int, height: int):
         self.width = width
         self.height = height
+        # Полуразмеры окна считаем один раз — update() не делит каждый кадр.
+        self._half_w = width // 2
+        self._half_h = height // 2
         self.x = 0.0
         self.y = 0.0
         self.target: Optional[AnimatedSprite] = None
@@ -26,14 +29,16 @@ class Camera:
 
     def update(self, dt: float) -> None:
         """Обновить позицию камеры."""
-        if self.target:
-            target_pos = self.target.get_position()
-            target_x = target_pos[0] - self.width // 2
-            target_y = target_pos[1] - self.height // 2
+        target = self.target
+        if target:
+            # Читаем x/y напрямую: без вызова get_position() и кортежа.
+            target_x = target.x - self._half_w
+            target_y = target.y - self._half_h
 
             if self.smooth_follow:
-                self.x += (target_x - self.x) * self.follow_speed * dt
-                self.y += (target_y - self.y) * self.follow_speed * dt
+                factor = self.follow_speed * dt
+                self.x += (target_x - self.x) * factor
+                self.y += (target_y - self.y) * factor
             else:
                 self.x = target_x
                 self.y = target_y
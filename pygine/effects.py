@@ -1,236 +1,446 @@
-"""
-Система частиц и визуальных эффектов.
-"""
-
-import pygame
-import random
-import math
-from typing import List, Tuple, Optional
-
-
-class Particle:
-    """Базовая частица для системы эффектов."""
-
-    def __init__(
-        self,
-        x: float,
-        y: float,
-        velocity: Tuple[float, float] = (0, 0),
-        lifetime: float = 1.0,
-        color: Tuple[int, int, int] = (255, 255, 255),
-    ):
-        self.x = x
-        self.y = y
-        self.velocity = list(velocity)
-        self.lifetime = lifetime
-        self.max_lifetime = lifetime
-        self.color = color
-        self.size = 2
-        self.alive = True
-
-    def update(self, dt: float) -> None:
-        """Обновить состояние частицы."""
-        if not self.alive:
-            return
-
-        self.x += self.velocity[0] * dt
-        self.y += self.velocity[1] * dt
-        self.lifetime -= dt
-
-        if self.lifetime <= 0:
-            self.alive = False
-
-    def draw(self, screen: pygame.Surface) -> None:
-        """Нарисовать частицу на экране."""
-        if self.alive:
-            pygame.draw.circle(
-                screen, self.color, (int(self.x), int(self.y)), self.size
-            )
-
-
-class ParticleSystem:
-    """Система для управления множеством частиц."""
-
-    def __init__(self):
-        self.particles: List[Particle] = []
-
-    def add_particle(self, particle: Particle) -> None:
-        """Добавить частицу в систему."""
-        self.particles.append(particle)
-
-    def update(self, dt: float) -> None:
-        """Обновить все частицы."""
-        for particle in self.particles[:]:
-            particle.update(dt)
-            if not particle.alive:
-                self.particles.remove(particle)
-
-    def draw(self, screen: pygame.Surface) -> None:
-        """Нарисовать все частицы."""
-        for particle in self.particles:
-            particle.draw(screen)
-
-    def clear(self) -> None:
-        """Удалить все частицы."""
-        self.particles.clear()
-
-
-class ScreenShake:
-    """Система тряски экрана для создания эффектов воздействия."""
-
-    def __init__(self):
-        self.intensity = 0.0  # Текущая интенсивность тряски
-        self.duration = 0.0   # Оставшееся время тряски
-        self.frequency = 30.0 # Частота тряски (в герцах)
-        self.time = 0.0       # Внутренний таймер
-        
-    def start_shake(self, intensity: float, duration: float, frequency: float = 30.0) -> None:
-        """
-        Начать эффект тряски экрана.
-        
-        Аргументы:
-            intensity: Интенсивность тряски (в пикселях)
-            duration: Продолжительность тряски (в секундах)
-            frequency: Частота тряски (колебаний в секунду)
-        """
-        self.intensity = max(intensity, self.intensity)  # Берём максимальную интенсивность
-        self.duration = max(duration, self.duration)     # Продлеваем время, если нужно
-        self.frequency = frequency
-        
-    def update(self, dt: float) -> None:
-        """Обновить состояние тряски."""
-        if self.duration > 0:
-            self.duration -= dt
-            self.time += dt
-            
-            # Уменьшаем интенсивность со временем
-            if self.duration <= 0:
-                self.intensity = 0.0
-                self.duration = 0.0
-                self.time = 0.0
-            
-    def get_offset(self) -> Tuple[float, float]:
-        """
-        Получить текущее смещение для тряски.
-        
-        Возвращает:
-            Кортеж (offset_x, offset_y) в пикселях
-        """
-        if self.duration <= 0 or self.intensity <= 0:
-            return (0.0, 0.0)
-            
-        # Создаём случайное смещение на основе времени и частоты
-        angle = self.time * self.frequency * 2 * math.pi
-        random_factor = random.uniform(0.7, 1.0)  # Добавляем случайность
-        
-        offset_x = math.sin(angle) * self.intensity * random_factor
-        offset_y = math.cos(angle * 1.3) * self.intensity * random_factor  # Разная частота для Y
-        
-        return (offset_x, offset_y)
-        
-    def is_active(self) -> bool:
-        """Проверить, активна ли тряска."""
-        return self.duration > 0 and self.intensity > 0
-
-
-# Глобальная система частиц
-_particle_system = ParticleSystem()
-
-# Глобальная система тряски экрана
-_screen_shake = ScreenShake()
-
-
-def create_explosion(x: float, y: float, size: int = 20) -> None:
-    """Создать эффект взрыва в указанной позиции."""
-    for _ in range(size):
-        angle = random.uniform(0, 2 * math.pi)
-        speed = random.uniform(50, 150)
-        vx = math.cos(angle) * speed
-        vy = math.sin(angle) * speed
-
-        particle = Particle(
-            x,
-            y,
-            (vx, vy),
-            lifetime=random.uniform(0.5, 1.5),
-            color=(255, random.randint(100, 255), 0),
-        )
-        _particle_system.add_particle(particle)
-
-
-def create_smoke(x: float, y: float, amount: int = 10) -> None:
-    """Создать эффект дыма в указанной позиции."""
-    for _ in range(amount):
-        vx = random.uniform(-20, 20)
-        vy = random.uniform(-50, -20)
-
-        gray = random.randint(100, 200)
-        particle = Particle(
-            x, y, (vx, vy), lifetime=random.uniform(1.0, 3.0), color=(gray, gray, gray)
-        )
-        _particle_system.add_particle(particle)
-
-
-def create_sparkles(x: float, y: float, amount: int = 15) -> None:
-    """Создать эффект искр в указанной позиции."""
-    for _ in range(amount):
-        angle = random.uniform(0, 2 * math.pi)
-        speed = random.uniform(30, 100)
-        vx = math.cos(angle) * speed
-        vy = math.sin(angle) * speed
-
-        particle = Particle(
-            x,
-            y,
-            (vx, vy),
-            lifetime=random.uniform(0.3, 1.0),
-            color=(255, 255, random.randint(100, 255)),
-        )
-        _particle_system.add_particle(particle)
-
-
-def start_screen_shake(intensity: float, duration: float, frequency: float = 30.0) -> None:
-    """
-    Запустить эффект тряски экрана.
-    
-    Аргументы:
-        intensity: Интенсивность тряски (в пикселях, рекомендуется 1-10)
-        duration: Продолжительность тряски (в секундах)
-        frequency: Частота тряски (колебаний в секунду, по умолчанию 30)
-    
-    Пример:
-        >>> start_screen_shake(5, 0.5)  # Средняя тряска на полсекунды
-        >>> start_screen_shake(10, 1.0, 20)  # Сильная тряска на секунду с низкой частотой
-    """
-    _screen_shake.start_shake(intensity, duration, frequency)
-
-
-def get_screen_shake_offset() -> Tuple[float, float]:
-    """
-    Получить текущее смещение для тряски экрана.
-    
-    Возвращает:
-        Кортеж (offset_x, offset_y) в пикселях для применения к камере или отрисовке
-    """
-    return _screen_shake.get_offset()
-
-
-def is_screen_shaking() -> bool:
-    """
-    Проверить, активна ли тряска экрана.
-    
-    Возвращает:
-        True, если тряска активна
-    """
-    return _screen_shake.is_active()
-
-
-def update_effects(dt: float) -> None:
-    """Обновить все эффекты. Вызывать из игрового цикла."""
-    _particle_system.update(dt)
-    _screen_shake.update(dt)
-
-
-def draw_effects(screen: pygame.Surface) -> None:
-    """Отрисовать все эффекты. Вызывать из игрового цикла."""
-    _particle_system.draw(screen)
+"""
+Система частиц и визуальных эффектов.
+"""
+
+import pygame
+import random
+import math
+import numpy as np
+from functools import lru_cache
+from typing import List, Tuple, Optional
+
+# fblits (pygame-ce) отправляет весь список блитов одним вызовом C.
+_HAS_FBLITS = hasattr(pygame.Surface, "fblits")
+
+# Таблица синуса на 1024 значения: для пиксельной тряски точности
+# ~0.003 более чем достаточно, а выборка из таблицы заметно дешевле
+# вызова libm. Косинус берётся сдвигом фазы на pi/2.
+_SIN_SIZE = 1024
+_SIN = [math.sin(2 * math.pi * i / _SIN_SIZE) for i in range(_SIN_SIZE)]
+_SIN_SCALE = _SIN_SIZE / (2 * math.pi)
+_HALF_PI = math.pi / 2
+
+
+def _fsin(angle: float) -> float:
+    """Синус по таблице; угол в радианах, период 2*pi."""
+    return _SIN[int(angle * _SIN_SCALE) & (_SIN_SIZE - 1)]
+
+
+# Нулевое смещение тряски: один кортеж на модуль, чтобы спокойный
+# кадр не выделял новый (0.0, 0.0) при каждом запросе.
+_ZERO_OFFSET = (0.0, 0.0)
+
+# Готовая последовательность коэффициентов дрожания для тряски:
+# вместо вызова RNG на каждый кадр — выборка по номеру колебания.
+# Смещение становится детерминированным по времени, что дружит с
+# кэшированием «то же время — тот же результат».
+_JITTER = tuple(random.uniform(0.7, 1.0) for _ in range(32))
+
+
+class Particle:
+    """Базовая частица для системы эффектов."""
+
+    # Фиксированный набор полей без __dict__: доступ к атрибутам
+    # быстрее, а сами объекты заметно компактнее.
+    __slots__ = ('x', 'y', 'vx', 'vy', 'lifetime', 'max_lifetime',
+                 'color', 'size', 'alive')
+
+    def __init__(
+        self,
+        x: float,
+        y: float,
+        velocity: Tuple[float, float] = (0, 0),
+        lifetime: float = 1.0,
+        color: Tuple[int, int, int] = (255, 255, 255),
+    ):
+        self.x = x
+        self.y = y
+        # Скорость — два скаляра, а не список: без лишней аллокации
+        # на частицу и без индексации при интегрировании.
+        self.vx, self.vy = velocity
+        self.lifetime = lifetime
+        self.max_lifetime = lifetime
+        self.color = color
+        self.size = 2
+        self.alive = True
+
+    def update(self, dt: float) -> None:
+        """Обновить состояние частицы."""
+        if not self.alive:
+            return
+
+        self.x += self.vx * dt
+        self.y += self.vy * dt
+        self.lifetime -= dt
+
+        if self.lifetime <= 0:
+            self.alive = False
+
+    def draw(self, screen: pygame.Surface) -> None:
+        """Нарисовать частицу на экране."""
+        if self.alive:
+            pygame.draw.circle(
+                screen, self.color, (int(self.x), int(self.y)), self.size
+            )
+
+
+# Шаг огрубления цвета частиц: случайные оттенки сводятся к немногим
+# ключам кэша поверхностей, на глаз разница неразличима.
+_COLOR_QUANT_STEP = 16
+_COLOR_QUANT_MASK = 0x100 - _COLOR_QUANT_STEP
+
+
+@lru_cache(maxsize=512)
+def _render_circle(r: int, g: int, b: int, size: int) -> pygame.Surface:
+    """Отрисовать поверхность кружка; результат кэшируется LRU."""
+    diameter = size * 2
+    surf = pygame.Surface((diameter, diameter), pygame.SRCALPHA)
+    pygame.draw.circle(surf, (r, g, b), (size, size), size)
+    return surf
+
+
+def _get_circle_surf(r: int, g: int, b: int, size: int) -> pygame.Surface:
+    """Вернуть кэшированную поверхность кружка данного цвета и радиуса.
+
+    Цвет огрубляется до _COLOR_QUANT_STEP, чтобы случайные оттенки
+    частиц попадали в немногие ключи; вытеснением занимается LRU-кэш.
+    """
+    mask = _COLOR_QUANT_MASK
+    return _render_circle(int(r) & mask, int(g) & mask, int(b) & mask,
+                          int(size))
+
+
+class ParticleSystem:
+    """Система для управления множеством частиц.
+
+    Состояние хранится по схеме «структура из массивов»: координаты,
+    скорости и время жизни лежат в NumPy-массивах, поэтому интегрирование
+    движения и отсев умерших частиц выполняются векторно в C, а не циклом
+    Python по объектам. Ёмкость массивов удваивается по мере роста.
+    """
+
+    _START_CAPACITY = 64
+
+    def __init__(self):
+        capacity = self._START_CAPACITY
+        self._capacity = capacity
+        self._count = 0
+        self._x = np.empty(capacity, dtype=np.float32)
+        self._y = np.empty(capacity, dtype=np.float32)
+        self._vx = np.empty(capacity, dtype=np.float32)
+        self._vy = np.empty(capacity, dtype=np.float32)
+        self._life = np.empty(capacity, dtype=np.float32)
+        self._size = np.empty(capacity, dtype=np.int16)
+        self._color = np.empty((capacity, 3), dtype=np.uint8)
+        # Рабочие буферы: умножение скорости на dt и маска живых частиц
+        # пишутся сюда, не выделяя временные массивы каждый кадр.
+        self._tmp = np.empty(capacity, dtype=np.float32)
+        self._alive = np.empty(capacity, dtype=bool)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _grow(self) -> None:
+        """Удвоить ёмкость массивов, сохранив живые частицы."""
+        self._capacity *= 2
+        self._x = np.resize(self._x, self._capacity)
+        self._y = np.resize(self._y, self._capacity)
+        self._vx = np.resize(self._vx, self._capacity)
+        self._vy = np.resize(self._vy, self._capacity)
+        self._life = np.resize(self._life, self._capacity)
+        self._size = np.resize(self._size, self._capacity)
+        self._color = np.resize(self._color, (self._capacity, 3))
+        self._tmp = np.empty(self._capacity, dtype=np.float32)
+        self._alive = np.empty(self._capacity, dtype=bool)
+
+    def add_particle(self, particle: Particle) -> None:
+        """Добавить частицу в систему."""
+        n = self._count
+        if n == self._capacity:
+            self._grow()
+        self._x[n] = particle.x
+        self._y[n] = particle.y
+        self._vx[n] = particle.vx
+        self._vy[n] = particle.vy
+        self._life[n] = particle.lifetime
+        self._size[n] = particle.size
+        self._color[n] = particle.color
+        self._count = n + 1
+
+    def add_particles(self, particles) -> None:
+        """Добавить сразу несколько частиц.
+
+        Ёмкость резервируется один раз на всю пачку, поэтому дешевле,
+        чем add_particle в цикле.
+        """
+        particles = list(particles)
+        m = len(particles)
+        if m == 0:
+            return
+        while self._count + m > self._capacity:
+            self._grow()
+        n = self._count
+        for p in particles:
+            self._x[n] = p.x
+            self._y[n] = p.y
+            self._vx[n] = p.vx
+            self._vy[n] = p.vy
+            self._life[n] = p.lifetime
+            self._size[n] = p.size
+            self._color[n] = p.color
+            n += 1
+        self._count = n
+
+    def _add_bulk(self, xs, ys, vxs, vys, life, sizes, colors) -> None:
+        """Записать сразу пачку частиц в SoA-массивы.
+
+        Скалярные аргументы разворачиваются широковещательно; colors —
+        массив формы (m, 3).
+        """
+        m = len(colors)
+        while self._count + m > self._capacity:
+            self._grow()
+        n = self._count
+        end = n + m
+        self._x[n:end] = xs
+        self._y[n:end] = ys
+        self._vx[n:end] = vxs
+        self._vy[n:end] = vys
+        self._life[n:end] = life
+        self._size[n:end] = sizes
+        self._color[n:end] = colors
+        self._count = end
+
+    def update(self, dt: float) -> None:
+        """Обновить все частицы."""
+        n = self._count
+        if n == 0:
+            return
+
+        tmp = self._tmp[:n]
+        np.multiply(self._vx[:n], dt, out=tmp)
+        self._x[:n] += tmp
+        np.multiply(self._vy[:n], dt, out=tmp)
+        self._y[:n] += tmp
+        self._life[:n] -= dt
+
+        alive = self._alive[:n]
+        np.greater(self._life[:n], 0.0, out=alive)
+        k = int(np.count_nonzero(alive))
+        if k != n:
+            # Уплотняем живых к началу массивов одним булевым отбором.
+            self._x[:k] = self._x[:n][alive]
+            self._y[:k] = self._y[:n][alive]
+            self._vx[:k] = self._vx[:n][alive]
+            self._vy[:k] = self._vy[:n][alive]
+            self._life[:k] = self._life[:n][alive]
+            self._size[:k] = self._size[:n][alive]
+            self._color[:k] = self._color[:n][alive]
+            self._count = k
+
+    def draw(self, screen: pygame.Surface) -> None:
+        """Нарисовать все частицы."""
+        n = self._count
+        if n == 0:
+            return
+
+        # Вместо draw.circle на каждую частицу — один батч блитов
+        # кэшированных кружков: меньше переходов Python -> SDL.
+        sizes = self._size
+        colors = self._color
+        xs = (self._x[:n] - sizes[:n]).astype(np.int32)
+        ys = (self._y[:n] - sizes[:n]).astype(np.int32)
+        seq = [(_get_circle_surf(colors[i][0], colors[i][1], colors[i][2],
+                                 sizes[i]), (xs[i], ys[i]))
+               for i in range(n)]
+        if _HAS_FBLITS:
+            screen.fblits(seq)
+        else:
+            screen.blits(seq, doreturn=False)
+
+    def clear(self) -> None:
+        """Удалить все частицы."""
+        self._count = 0
+
+
+class ScreenShake:
+    """Система тряски экрана для создания эффектов воздействия."""
+
+    __slots__ = ('intensity', 'duration', 'frequency', 'time', '_active',
+                 '_cached_time', '_cached_offset')
+
+    def __init__(self):
+        self.intensity = 0.0  # Текущая интенсивность тряски
+        self.duration = 0.0   # Оставшееся время тряски
+        self.frequency = 30.0 # Частота тряски (в герцах)
+        self.time = 0.0       # Внутренний таймер
+        # Один флаг вместо пары сравнений duration/intensity на каждый
+        # запрос смещения; меняется только в start_shake и update.
+        self._active = False
+        # Смещение, вычисленное для текущего значения таймера: камера и
+        # отрисовка в одном кадре получают одинаковый результат, а
+        # sin/cos/uniform не считаются повторно.
+        self._cached_time = -1.0
+        self._cached_offset = (0.0, 0.0)
+        
+    def start_shake(self, intensity: float, duration: float, frequency: float = 30.0) -> None:
+        """
+        Начать эффект тряски экрана.
+        
+        Аргументы:
+            intensity: Интенсивность тряски (в пикселях)
+            duration: Продолжительность тряски (в секундах)
+            frequency: Частота тряски (колебаний в секунду)
+        """
+        self.intensity = max(intensity, self.intensity)  # Берём максимальную интенсивность
+        self.duration = max(duration, self.duration)     # Продлеваем время, если нужно
+        self.frequency = frequency
+        self._active = self.duration > 0 and self.intensity > 0
+        
+    def update(self, dt: float) -> None:
+        """Обновить состояние тряски."""
+        if self.duration > 0:
+            self.duration -= dt
+            self.time += dt
+            
+            # Уменьшаем интенсивность со временем
+            if self.duration <= 0:
+                self.intensity = 0.0
+                self.duration = 0.0
+                self.time = 0.0
+                self._active = False
+            
+    def get_offset(self) -> Tuple[float, float]:
+        """
+        Получить текущее смещение для тряски.
+        
+        Возвращает:
+            Кортеж (offset_x, offset_y) в пикселях
+        """
+        if not self._active:
+            return _ZERO_OFFSET
+
+        if self.time == self._cached_time:
+            return self._cached_offset
+
+        # Создаём псевдослучайное смещение на основе времени и частоты
+        phase = self.time * self.frequency
+        angle = phase * 2 * math.pi
+        random_factor = _JITTER[int(phase) & 31]  # Дрожание из таблицы
+
+        offset_x = _fsin(angle) * self.intensity * random_factor
+        offset_y = _fsin(angle * 1.3 + _HALF_PI) * self.intensity * random_factor  # Разная частота для Y
+
+        self._cached_time = self.time
+        self._cached_offset = (offset_x, offset_y)
+        return self._cached_offset
+        
+    def is_active(self) -> bool:
+        """Проверить, активна ли тряска."""
+        return self._active
+
+
+# Глобальная система частиц
+_particle_system = ParticleSystem()
+
+# Генератор для векторной раздачи параметров при создании частиц.
+_rng = np.random.default_rng()
+
+# Глобальная система тряски экрана
+_screen_shake = ScreenShake()
+
+
+def create_explosion(x: float, y: float, size: int = 20) -> None:
+    """Создать эффект взрыва в указанной позиции."""
+    # Все случайные параметры раздаются одним векторным вызовом RNG,
+    # тригонометрия тоже считается по массиву — без цикла Python.
+    angle = _rng.uniform(0.0, 2 * math.pi, size)
+    speed = _rng.uniform(50.0, 150.0, size)
+    lifetime = _rng.uniform(0.5, 1.5, size)
+    colors = np.empty((size, 3), dtype=np.uint8)
+    colors[:, 0] = 255
+    colors[:, 1] = _rng.integers(100, 256, size) & _COLOR_QUANT_MASK
+    colors[:, 2] = 0
+    _particle_system._add_bulk(
+        x, y, np.cos(angle) * speed, np.sin(angle) * speed,
+        lifetime, 2, colors,
+    )
+
+
+def create_smoke(x: float, y: float, amount: int = 10) -> None:
+    """Создать эффект дыма в указанной позиции."""
+    vx = _rng.uniform(-20.0, 20.0, amount)
+    vy = _rng.uniform(-50.0, -20.0, amount)
+    lifetime = _rng.uniform(1.0, 3.0, amount)
+    gray = _rng.integers(100, 201, amount) & _COLOR_QUANT_MASK
+    colors = np.empty((amount, 3), dtype=np.uint8)
+    colors[:, 0] = gray
+    colors[:, 1] = gray
+    colors[:, 2] = gray
+    _particle_system._add_bulk(x, y, vx, vy, lifetime, 2, colors)
+
+
+def create_sparkles(x: float, y: float, amount: int = 15) -> None:
+    """Создать эффект искр в указанной позиции."""
+    angle = _rng.uniform(0.0, 2 * math.pi, amount)
+    speed = _rng.uniform(30.0, 100.0, amount)
+    lifetime = _rng.uniform(0.3, 1.0, amount)
+    colors = np.empty((amount, 3), dtype=np.uint8)
+    colors[:, 0] = 255
+    colors[:, 1] = 255
+    colors[:, 2] = _rng.integers(100, 256, amount) & _COLOR_QUANT_MASK
+    _particle_system._add_bulk(
+        x, y, np.cos(angle) * speed, np.sin(angle) * speed,
+        lifetime, 2, colors,
+    )
+
+
+def start_screen_shake(intensity: float, duration: float, frequency: float = 30.0) -> None:
+    """
+    Запустить эффект тряски экрана.
+    
+    Аргументы:
+        intensity: Интенсивность тряски (в пикселях, рекомендуется 1-10)
+        duration: Продолжительность тряски (в секундах)
+        frequency: Частота тряски (колебаний в секунду, по умолчанию 30)
+    
+    Пример:
+        >>> start_screen_shake(5, 0.5)  # Средняя тряска на полсекунды
+        >>> start_screen_shake(10, 1.0, 20)  # Сильная тряска на секунду с низкой частотой
+    """
+    _screen_shake.start_shake(intensity, duration, frequency)
+
+
+def get_screen_shake_offset() -> Tuple[float, float]:
+    """
+    Получить текущее смещение для тряски экрана.
+    
+    Возвращает:
+        Кортеж (offset_x, offset_y) в пикселях для применения к камере или отрисовке
+    """
+    return _screen_shake.get_offset()
+
+
+def is_screen_shaking() -> bool:
+    """
+    Проверить, активна ли тряска экрана.
+    
+    Возвращает:
+        True, если тряска активна
+    """
+    return _screen_shake.is_active()
+
+
+def update_effects(dt: float) -> None:
+    """Обновить все эффекты. Вызывать из игрового цикла."""
+    # Проверки «есть ли работа» подняты сюда из методов: в спокойном
+    # кадре (ни частиц, ни тряски) не создаётся ни одного кадра вызова.
+    if _particle_system._count:
+        _particle_system.update(dt)
+    if _screen_shake._active:
+        _screen_shake.update(dt)
+
+
+def draw_effects(screen: pygame.Surface) -> None:
+    """Отрисовать все эффекты. Вызывать из игрового цикла."""
+    _particle_system.draw(screen)
@@ -1,454 +1,800 @@
-"""
-Главный игровой класс, управляющий игровым циклом и окном.
-"""
-
-import pygame
-import sys
-from typing import Tuple, Optional, Callable, List, Union
-from .utils import update_input_state
-from .effects import get_screen_shake_offset
-
-
-class Game:
-    """
-    Главный игровой класс, который управляет окном, игровым циклом
-    и базовой функциональностью.
-
-    Класс предоставляет простой интерфейс для создания игр с автоматическим
-    управлением игровым циклом, обработкой событий и контролем частоты кадров.
-
-    Аргументы:
-        width: Ширина окна в пикселях
-        height: Высота окна в пикселях
-        title: Заголовок окна
-        fps: Целевая частота кадров
-        background_color: Цвет фона в формате (R, G, B)
-        background_image: Путь к изображению фона (опционально)
-        *,
-        create_display: bool = True,
-
-    Пример:
-        >>> game = Game(800, 600, "Моя Игра")
-        >>> player = AnimatedSprite("player.png", (32, 32))
-        >>>
-        >>> def update():
-        ...     player.update()
-        ...
-        >>> def draw():
-        ...     player.draw(game.screen)
-        ...
-        >>> game.run(update, draw)
-    
-    Пример с фоновым изображением:
-        >>> game = Game(800, 600, "Игра с фоном", background_image="background.png")
-        >>> game.run(update, draw)
-    """
-
-    def __init__(
-        self,
-        width: int = 800,
-        height: int = 600,
-        title: str = "Pygame Easy Game",
-        fps: int = 60,
-        background_color: Tuple[int, int, int] = (50, 50, 50),
-        background_image: Optional[str] = None,
-        *,
-        create_display: bool = True,
-    ):
-        # Инициализируем pygame
-        if not pygame.get_init():
-            pygame.init()
-
-        # Свойства окна
-        self.width = width
-        self.height = height
-        self.title = title
-        self.fps = fps
-        self.background_color = background_color
-
-        # Фоновое изображение (инициализируем переменные)
-        self.background_image_path = background_image
-        self.background_image = None
-        self.background_surface = None
-
-        # Создаём окно, только если об этом явно не попросили отказаться.
-        if create_display:
-            self.screen = pygame.display.set_mode((width, height))
-            pygame.display.set_caption(title)
-        else:
-            # Если пользователь уже создал окно – забираем его.
-            existing = pygame.display.get_surface()
-            if existing is not None:
-                self.screen = existing
-            else:
-                # Fallback: создаём временную поверхность (off-screen).
-                self.screen = pygame.Surface((width, height))
-
-        # Загружаем фоновое изображение после создания окна
-        if background_image:
-            self._load_background_image(background_image)
-
-        # Параметры игрового цикла
-        self.clock = pygame.time.Clock()
-        self.running = False
-        self.paused = False
-
-        # Отслеживание дельта-времени
-        self.dt = 0.0
-        self.last_time = 0.0
-
-        # Колбэки событий
-        self.update_callback: Optional[Callable] = None
-        self.draw_callback: Optional[Callable] = None
-        self.event_callbacks: List[Callable] = []
-
-        # Группа спрайтов для автоматического управления
-        self.all_sprites = pygame.sprite.Group()
-
-        # Отладочная информация
-        self.show_fps = False
-        self.font = None
-
-    def _load_background_image(self, image_path: str) -> None:
-        """
-        Загрузить и масштабировать фоновое изображение.
-        
-        Аргументы:
-            image_path: Путь к файлу изображения
-        """
-        try:
-            # Загружаем оригинальное изображение
-            self.background_image = pygame.image.load(image_path).convert()
-            
-            # Масштабируем изображение под размеры окна
-            self.background_surface = pygame.transform.scale(
-                self.background_image, (self.width, self.height)
-            )
-            
-        except pygame.error as e:
-            print(f"Предупреждение: Не удалось загрузить фоновое изображение '{image_path}': {e}")
-            print("Будет использован цветовой фон.")
-            self.background_image = None
-            self.background_surface = None
-
-    def run(
-        self,
-        update_func: Optional[Callable] = None,
-        draw_func: Optional[Callable] = None,
-    ) -> None:
-        """
-        Запустить основной игровой цикл.
-
-        Аргументы:
-            update_func: Функция, вызываемая каждый кадр для логики игры
-            draw_func: Функция, вызываемая каждый кадр для отрисовки
-
-        Пример:
-            >>> def update():
-            ...     # Логика игры
-            ...     pass
-            ...
-            >>> def draw():
-            ...     # Отрисовка
-            ...     pass
-            ...
-            >>> game.run(update, draw)
-        """
-        self.update_callback = update_func
-        self.draw_callback = draw_func
-        self.running = True
-
-        try:
-            self._game_loop()
-        except KeyboardInterrupt:
-            pass
-        finally:
-            self.quit()
-
-    def _game_loop(self) -> None:
-        """Реализация основного игрового цикла."""
-        while self.running:
-            # Calculate delta time
-            current_time = pygame.time.get_ticks() / 1000.0
-            if self.last_time > 0:
-                self.dt = current_time - self.last_time
-            else:
-                self.dt = 1.0 / self.fps
-            self.last_time = current_time
-
-            # Handle events
-            self._handle_events()
-
-            # Update input state
-            update_input_state()
-
-            if not self.paused:
-                # Update game logic
-                self._update()
-
-            # Draw everything
-            self._draw()
-
-            # Maintain frame rate
-            self.clock.tick(self.fps)
-
-    def _handle_events(self) -> None:
-        """Обработка событий pygame."""
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                self.running = False
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_F1:
-                    self.toggle_fps_display()
-                elif event.key == pygame.K_PAUSE or event.key == pygame.K_p:
-                    self.toggle_pause()
-
-            # Call custom event callbacks
-            for callback in self.event_callbacks:
-                callback(event)
-
-    def _update(self) -> None:
-        """Обновить игровую логику."""
-        # Update all sprites in the group
-        self.all_sprites.update(self.dt)
-
-        # Call custom update function
-        if self.update_callback:
-            self.update_callback()
-
-    def _draw(self) -> None:
-        """Отрисовать всё на экран."""
-        # Получаем смещение тряски экрана
-        shake_offset = get_screen_shake_offset()
-        
-        # Создаём временную поверхность для применения тряски
-        if shake_offset != (0.0, 0.0):
-            # Создаём временный экран для отрисовки
-            temp_surface = pygame.Surface((self.width, self.height))
-            original_screen = self.screen
-            self.screen = temp_surface
-        
-        # Отрисовка фона
-        if self.background_surface is not None:
-            # Используем фоновое изображение
-            self.screen.blit(self.background_surface, (0, 0))
-        else:
-            # Используем цветовой фон
-            self.screen.fill(self.background_color)
-
-        # Draw all sprites
-        self.all_sprites.draw(self.screen)
-
-        # Call custom draw function
-        if self.draw_callback:
-            self.draw_callback()
-
-        # Draw debug information
-        if self.show_fps:
-            self._draw_fps()
-
-        # Применяем тряску, если активна
-        if shake_offset != (0.0, 0.0):
-            # Восстанавливаем оригинальный экран
-            self.screen = original_screen
-            # Очищаем экран и рисуем с смещением
-            self.screen.fill((0, 0, 0))  # Чёрный фон для границ при тряске
-            self.screen.blit(temp_surface, (int(shake_offset[0]), int(shake_offset[1])))
-
-        # Обновляем только если инициализировано окно отображения
-        if pygame.display.get_init() and pygame.display.get_surface() is not None:
-            pygame.display.flip()
-
-    def _draw_fps(self) -> None:
-        """Отрисовать счётчик FPS."""
-        if not self.font:
-            self.font = pygame.font.Font(None, 36)
-
-        fps_text = f"FPS: {int(self.clock.get_fps())}"
-        fps_surface = self.font.render(fps_text, True, (255, 255, 255))
-        self.screen.blit(fps_surface, (10, 10))
-
-    def add_sprite(self, sprite: pygame.sprite.Sprite) -> None:
-        """
-        Добавить спрайт в систему автоматического обновления и отрисовки.
-
-        Аргументы:
-            sprite: Спрайт, который нужно добавить
-        """
-        self.all_sprites.add(sprite)
-
-    def remove_sprite(self, sprite: pygame.sprite.Sprite) -> None:
-        """
-        Удалить спрайт из системы автоматического управления.
-
-        Аргументы:
-            sprite: Спрайт, который нужно удалить
-        """
-        self.all_sprites.remove(sprite)
-
-    def add_event_callback(self, callback: Callable) -> None:
-        """
-        Добавить пользовательский обработчик событий.
-
-        Аргументы:
-            callback: Функция, принимающая объект события pygame
-        """
-        self.event_callbacks.append(callback)
-
-    def set_background_color(self, color: Tuple[int, int, int]) -> None:
-        """
-        Установить цвет фона.
-
-        Аргументы:
-            color: RGB-кортеж цвета (0–255)
-        """
-        self.background_color = color
-        # Если установлен цвет фона, убираем фоновое изображение
-        self.background_surface = None
-
-    def set_background_image(self, image_path: Optional[str]) -> None:
-        """
-        Установить фоновое изображение.
-        
-        Изображение автоматически масштабируется под размеры окна.
-        Передача None отключает фоновое изображение.
-
-        Аргументы:
-            image_path: Путь к файлу изображения или None для отключения
-        """
-        if image_path is None:
-            self.background_image_path = None
-            self.background_image = None
-            self.background_surface = None
-        else:
-            self.background_image_path = image_path
-            self._load_background_image(image_path)
-
-    def has_background_image(self) -> bool:
-        """
-        Проверить, установлено ли фоновое изображение.
-        
-        Возвращает:
-            True, если фоновое изображение загружено и готово к использованию
-        """
-        return self.background_surface is not None
-
-    def set_title(self, title: str) -> None:
-        """
-        Изменить заголовок окна.
-
-        Аргументы:
-            title: Новый заголовок окна
-        """
-        self.title = title
-        pygame.display.set_caption(title)
-
-    def set_fps(self, fps: int) -> None:
-        """
-        Задать целевую частоту кадров.
-
-        Аргументы:
-            fps: Кадров в секунду
-        """
-        self.fps = max(1, fps)
-
-    def toggle_fps_display(self) -> None:
-        """Переключить отображение счётчика FPS."""
-        self.show_fps = not self.show_fps
-
-    def toggle_pause(self) -> None:
-        """Переключить состояние паузы игры."""
-        self.paused = not self.paused
-
-    def pause(self) -> None:
-        """Поставить игру на паузу."""
-        self.paused = True
-
-    def resume(self) -> None:
-        """Возобновить игру."""
-        self.paused = False
-
-    def quit(self) -> None:
-        """
-        Завершить игру и очистить ресурсы.
-        """
-        self.running = False
-        pygame.quit()
-        sys.exit()
-
-    def get_screen_rect(self) -> pygame.Rect:
-        """
-        Получить прямоугольник экрана для проверки границ.
-
-        Возвращает:
-            Объект Rect, представляющий границы экрана
-        """
-        return pygame.Rect(0, 0, self.width, self.height)
-
-    def get_center(self) -> Tuple[int, int]:
-        """
-        Получить центр экрана.
-
-        Возвращает:
-            Координаты центра (x, y)
-        """
-        return (self.width // 2, self.height // 2)
-
-    def is_point_on_screen(self, x: int, y: int) -> bool:
-        """
-        Проверить, находится ли точка внутри границ экрана.
-
-        Аргументы:
-            x: Координата X
-            y: Координата Y
-
-        Возвращает:
-            True — если точка на экране
-        """
-        return 0 <= x < self.width and 0 <= y < self.height
-
-    def screenshot(self, filename: str = "screenshot.png") -> None:
-        """
-        Сохранить скриншот текущего экрана.
-
-        Аргументы:
-            filename: Путь к файлу скриншота
-        """
-        pygame.image.save(self.screen, filename)
-
-    def get_delta_time(self) -> float:
-        """
-        Получить дельта-время (время с прошлого кадра) в секундах.
-
-        Возвращает:
-            Дельта-время в секундах
-        """
-        return self.dt
-
-    def get_fps(self) -> float:
-        """
-        Получить текущую частоту кадров.
-
-        Возвращает:
-            Текущее значение FPS
-        """
-        return self.clock.get_fps()
-
-    def debug_info(self) -> dict:
-        """
-        Получить отладочную информацию о состоянии игры.
-
-        Возвращает:
-            Словарь с отладочной информацией
-        """
-        return {
-            "fps": self.get_fps(),
-            "dt": self.dt,
-            "running": self.running,
-            "paused": self.paused,
-            "sprite_count": len(self.all_sprites),
-            "screen_size": (self.width, self.height),
-            "background_color": self.background_color,
-            "background_image": self.background_image_path,
-            "has_background_image": self.has_background_image(),
-        }
+"""
+Главный игровой класс, управляющий игровым циклом и окном.
+"""
+
+import os
+import pygame
+import sys
+from time import perf_counter
+from typing import Tuple, Optional, Callable, List, Union
+from .utils import update_input_state
+from .effects import get_screen_shake_offset
+
+# fblits (pygame-ce) отправляет весь список блитов одним вызовом C.
+_HAS_FBLITS = hasattr(pygame.Surface, "fblits")
+
+
+def _noop() -> None:
+    """Заглушка колбэка: вызывается безусловно вместо проверки на None."""
+    return None
+
+
+class _BatchGroup(pygame.sprite.Group):
+    """Группа спрайтов с пакетной отрисовкой.
+
+    Вместо отдельного blit на каждый спрайт список пар (image, rect)
+    собирается целиком и уходит в SDL одним вызовом fblits/blits —
+    порядок отрисовки при этом сохраняется. Список спрайтов кэшируется:
+    состав группы меняется редко, а Group.sprites() строит новый список
+    при каждом обращении.
+
+    Спрайты с атрибутом blendmode рисуются сериями: батч сбрасывается
+    на каждой смене режима, и вся серия уходит одним вызовом с нужным
+    special_flags. Наличие blendmode проверяется при изменении состава
+    группы — если режим меняется у живого спрайта, перечислите его
+    заново через remove/add.
+    """
+
+    def __init__(self, *sprites):
+        self._sprite_cache = None
+        self._has_blend = False
+        super().__init__(*sprites)
+
+    # add_internal/remove_internal — единые точки изменения состава
+    # группы в pygame (через них идут и add/remove, и Sprite.kill).
+    def add_internal(self, sprite, layer=None):
+        self._sprite_cache = None
+        super().add_internal(sprite, layer)
+
+    def remove_internal(self, sprite):
+        self._sprite_cache = None
+        super().remove_internal(sprite)
+
+    def sprites(self):
+        cache = self._sprite_cache
+        if cache is None:
+            cache = self._sprite_cache = list(self.spritedict)
+            self._has_blend = any(
+                getattr(sp, "blendmode", 0) for sp in cache
+            )
+        return cache
+
+    def draw(self, surface: pygame.Surface) -> None:
+        sprites = self.sprites()
+        if not sprites:
+            return
+        if self._has_blend:
+            self._draw_blend_runs(surface, sprites)
+            return
+        seq = [(sp.image, sp.rect) for sp in sprites]
+        if _HAS_FBLITS:
+            surface.fblits(seq)
+        else:
+            surface.blits(seq, doreturn=False)
+
+    @staticmethod
+    def _draw_blend_runs(surface, sprites) -> None:
+        """Отрисовать спрайты сериями с одинаковым режимом смешивания."""
+        seq = []
+        mode = getattr(sprites[0], "blendmode", 0) or 0
+        for sp in sprites:
+            sp_mode = getattr(sp, "blendmode", 0) or 0
+            if sp_mode != mode:
+                if _HAS_FBLITS:
+                    surface.fblits(seq, mode)
+                else:
+                    surface.blits(
+                        [(img, rect, None, mode) for img, rect in seq],
+                        doreturn=False,
+                    )
+                seq = []
+                mode = sp_mode
+            seq.append((sp.image, sp.rect))
+        if _HAS_FBLITS:
+            surface.fblits(seq, mode)
+        else:
+            surface.blits(
+                [(img, rect, None, mode) for img, rect in seq],
+                doreturn=False,
+            )
+
+
+class Game:
+    """
+    Главный игровой класс, который управляет окном, игровым циклом
+    и базовой функциональностью.
+
+    Класс предоставляет простой интерфейс для создания игр с автоматическим
+    управлением игровым циклом, обработкой событий и контролем частоты кадров.
+
+    Аргументы:
+        width: Ширина окна в пикселях
+        height: Высота окна в пикселях
+        title: Заголовок окна
+        fps: Целевая частота кадров
+        background_color: Цвет фона в формате (R, G, B)
+        background_image: Путь к изображению фона (опционально)
+        *,
+        create_display: bool = True,
+        headless: bool = False — рендер в Surface без окна
+                  (SDL_VIDEODRIVER=dummy, display не используется)
+
+    Пример:
+        >>> game = Game(800, 600, "Моя Игра")
+        >>> player = AnimatedSprite("player.png", (32, 32))
+        >>>
+        >>> def update():
+        ...     player.update()
+        ...
+        >>> def draw():
+        ...     player.draw(game.screen)
+        ...
+        >>> game.run(update, draw)
+    
+    Пример с фоновым изображением:
+        >>> game = Game(800, 600, "Игра с фоном", background_image="background.png")
+        >>> game.run(update, draw)
+    """
+
+    def __init__(
+        self,
+        width: int = 800,
+        height: int = 600,
+        title: str = "Pygame Easy Game",
+        fps: int = 60,
+        background_color: Tuple[int, int, int] = (50, 50, 50),
+        background_image: Optional[str] = None,
+        background_mode: str = "scale",
+        *,
+        create_display: bool = True,
+        headless: bool = False,
+    ):
+        # Безголовый режим: SDL работает на драйвере-заглушке, окно не
+        # создаётся вовсе — кадры рисуются в обычную Surface (например,
+        # для пакетного рендеринга или CI).
+        if headless:
+            os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+            create_display = False
+
+        # Инициализируем pygame
+        if not pygame.get_init():
+            pygame.init()
+
+        # Пропускаем в очередь только те события, которые игра и сцены
+        # реально потребляют: без фильтра один проход мыши по окну
+        # способен забить очередь SDL событиями, которые _handle_events
+        # всё равно просто переберёт и выбросит.
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([
+            pygame.QUIT,
+            pygame.KEYDOWN, pygame.KEYUP,
+            pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP,
+            pygame.MOUSEMOTION,
+            pygame.USEREVENT,
+        ])
+
+        # Свойства окна
+        self.width = width
+        self.height = height
+        self.title = title
+        self.fps = fps
+        self.background_color = background_color
+
+        # Фоновое изображение (инициализируем переменные)
+        if background_mode not in ("scale", "tile", "center"):
+            raise ValueError(
+                f"background_mode must be 'scale', 'tile' or 'center', "
+                f"got {background_mode!r}"
+            )
+        self.background_image_path = background_image
+        self.background_image = None
+        self.background_surface = None
+        self.background_mode = background_mode
+        # Готовый список блитов для режима tile и позиция для center.
+        self._bg_tile_seq = None
+        self._bg_pos = (0, 0)
+
+        # Очистка фона — перепривязываемый метод: выбор «картинка или
+        # заливка» делается при смене фона, а не ветвлением в каждом
+        # кадре _draw.
+        self._draw_background = self._fill_background
+
+        # Создаём окно, только если об этом явно не попросили отказаться.
+        if headless:
+            self.screen = pygame.Surface((width, height))
+        elif create_display:
+            self.screen = pygame.display.set_mode((width, height))
+            pygame.display.set_caption(title)
+        else:
+            # Если пользователь уже создал окно – забираем его.
+            existing = pygame.display.get_surface()
+            if existing is not None:
+                self.screen = existing
+            else:
+                # Fallback: создаём временную поверхность (off-screen).
+                self.screen = pygame.Surface((width, height))
+
+        # Окно либо создано выше, либо его нет до конца работы: флаг
+        # вычисляется один раз, и _draw не опрашивает display каждый кадр.
+        self._display_ready = (
+            not headless and pygame.display.get_surface() is not None
+        )
+
+        # Загружаем фоновое изображение после создания окна
+        if background_image:
+            self._load_background_image(background_image)
+
+        # Параметры игрового цикла
+        self.clock = pygame.time.Clock()
+        self.running = False
+        self.paused = False
+
+        # Отслеживание дельта-времени
+        self.dt = 0.0
+        self.last_time = 0.0
+
+        # Снимок клавиатуры, общий для всех потребителей в кадре
+        self._keys = pygame.key.get_pressed()
+
+        # Колбэки событий (null-object: всегда вызываемы, без проверок)
+        self.update_callback: Callable = _noop
+        self.draw_callback: Callable = _noop
+        self.event_callbacks: List[Callable] = []
+        # Кортеж-зеркало списка: перебор в цикле событий быстрее,
+        # а пустой кортеж отсекает внутренний цикл одной проверкой.
+        self._event_callbacks = ()
+
+        # Встроенные реакции на события — таблица вместо цепочки if.
+        self._event_handlers = {
+            pygame.QUIT: self._on_quit,
+            pygame.KEYDOWN: self._on_keydown,
+        }
+
+        # Группа спрайтов для автоматического управления
+        self.all_sprites = _BatchGroup()
+
+        # Поверхность для тряски экрана: создаётся при первой тряске и
+        # переиспользуется, чтобы не выделять полноэкранный буфер
+        # каждый трясущийся кадр.
+        self._shake_surface = None
+
+        # Адаптивная отрисовка (выключена по умолчанию): когда кадр не
+        # менялся, _draw пропускается целиком, а на экране остаётся
+        # прошлый буфер.
+        self._adaptive = False
+        self._dirty = True
+        self._sprite_state = None
+
+        # Отладочная информация
+        self.show_fps = False
+        self.font = None
+        # Кэш счётчика FPS: растеризованные цифры и готовая строка —
+        # шрифт перерисовывается только при смене значения.
+        self._digit_cache = None
+        self._fps_prefix = None
+        self._last_fps_int = -1
+        self._fps_surface = None
+
+    def _load_background_image(self, image_path: str) -> None:
+        """
+        Загрузить и подготовить фоновое изображение.
+
+        В режиме scale изображение масштабируется под окно; в режимах
+        tile и center хранится оригинал — память и трафик блитов при
+        этом зависят от размера картинки, а не окна.
+
+        Аргументы:
+            image_path: Путь к файлу изображения
+        """
+        try:
+            # Загружаем оригинальное изображение
+            self.background_image = pygame.image.load(image_path).convert()
+
+            mode = self.background_mode
+            if mode == "scale":
+                # Масштабируем изображение под размеры окна
+                self.background_surface = pygame.transform.scale(
+                    self.background_image, (self.width, self.height)
+                )
+                self._draw_background = self._blit_background
+            elif mode == "tile":
+                self.background_surface = self.background_image
+                tw, th = self.background_surface.get_size()
+                # Сетка позиций считается один раз: в кадре остаётся
+                # только один вызов fblits по готовому списку.
+                self._bg_tile_seq = [
+                    (self.background_surface, (x, y))
+                    for y in range(0, self.height, th)
+                    for x in range(0, self.width, tw)
+                ]
+                self._draw_background = self._tile_background
+            else:  # center
+                self.background_surface = self.background_image
+                tw, th = self.background_surface.get_size()
+                self._bg_pos = ((self.width - tw) // 2,
+                                (self.height - th) // 2)
+                self._draw_background = self._center_background
+
+        except pygame.error as e:
+            print(f"Предупреждение: Не удалось загрузить фоновое изображение '{image_path}': {e}")
+            print("Будет использован цветовой фон.")
+            self.background_image = None
+            self.background_surface = None
+            self._draw_background = self._fill_background
+
+    def run(
+        self,
+        update_func: Optional[Callable] = None,
+        draw_func: Optional[Callable] = None,
+    ) -> None:
+        """
+        Запустить основной игровой цикл.
+
+        Аргументы:
+            update_func: Функция, вызываемая каждый кадр для логики игры
+            draw_func: Функция, вызываемая каждый кадр для отрисовки
+
+        Пример:
+            >>> def update():
+            ...     # Логика игры
+            ...     pass
+            ...
+            >>> def draw():
+            ...     # Отрисовка
+            ...     pass
+            ...
+            >>> game.run(update, draw)
+        """
+        self.update_callback = update_func or _noop
+        self.draw_callback = draw_func or _noop
+        self.running = True
+
+        try:
+            self._game_loop()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.quit()
+
+    def _game_loop(self) -> None:
+        """Реализация основного игрового цикла.
+
+        Часто используемые связанные методы привязаны к локальным
+        именам до цикла: LOAD_FAST вместо поиска атрибута на каждом
+        из ~60 кадров в секунду.
+        """
+        handle_events = self._handle_events
+        draw = self._draw
+        sprites_update = self.all_sprites.update
+        clock_tick = self.clock.tick
+        get_pressed = pygame.key.get_pressed
+
+        while self.running:
+            # Дельта-время по perf_counter: субмиллисекундная точность
+            # вместо миллисекундной сетки get_ticks. Clock.tick ниже
+            # остаётся только для ограничения частоты кадров.
+            current_time = perf_counter()
+            if self.last_time > 0:
+                self.dt = current_time - self.last_time
+            else:
+                self.dt = 1.0 / self.fps
+            self.last_time = current_time
+
+            # Handle events
+            handle_events()
+
+            # Update input state
+            update_input_state()
+            self._keys = get_pressed()
+
+            if not self.paused:
+                # Логика кадра: группа спрайтов и пользовательский колбэк
+                # (бывший _update встроен прямо в цикл).
+                sprites_update(self.dt)
+                self.update_callback()
+
+                # В адаптивном режиме сверяем видимое состояние спрайтов:
+                # сдвиг или смена кадра автоматически помечает кадр грязным.
+                if self._adaptive and not self._dirty:
+                    state = [(id(sp.image), sp.rect.x, sp.rect.y)
+                             for sp in self.all_sprites.sprites()]
+                    if state != self._sprite_state:
+                        self._sprite_state = state
+                        self._dirty = True
+
+            # Draw everything
+            draw()
+
+            # Maintain frame rate
+            clock_tick(self.fps)
+
+    def _on_quit(self, event) -> None:
+        """Встроенная реакция на закрытие окна."""
+        self.running = False
+
+    def _on_keydown(self, event) -> None:
+        """Встроенные горячие клавиши (FPS-счётчик, пауза)."""
+        if event.key == pygame.K_F1:
+            self.toggle_fps_display()
+        elif event.key == pygame.K_PAUSE or event.key == pygame.K_p:
+            self.toggle_pause()
+
+    def _handle_events(self) -> None:
+        """Обработка событий pygame."""
+        handlers = self._event_handlers
+        callbacks = self._event_callbacks
+        for event in pygame.event.get():
+            handler = handlers.get(event.type)
+            if handler is not None:
+                handler(event)
+
+            # Call custom event callbacks
+            if callbacks:
+                for callback in callbacks:
+                    callback(event)
+
+    def _draw(self) -> None:
+        """Отрисовать всё на экран."""
+        # Получаем смещение тряски экрана
+        shake_offset = get_screen_shake_offset()
+
+        # Адаптивный пропуск: статичный кадр не перерисовывается и не
+        # выводится — в буфере уже лежит точно такое же изображение.
+        if (self._adaptive and not self._dirty
+                and shake_offset == (0.0, 0.0) and not self.show_fps):
+            return
+        self._dirty = False
+        
+        # Подменяем экран кэшированной поверхностью для применения тряски
+        if shake_offset != (0.0, 0.0):
+            temp_surface = self._shake_surface
+            if temp_surface is None or temp_surface.get_size() != (self.width, self.height):
+                temp_surface = pygame.Surface((self.width, self.height))
+                self._shake_surface = temp_surface
+            original_screen = self.screen
+            self.screen = temp_surface
+        
+        # Отрисовка фона (метод перепривязан под текущий тип фона)
+        self._draw_background()
+
+        # Draw all sprites
+        self.all_sprites.draw(self.screen)
+
+        # Call custom draw function.
+        # Колбэк может вернуть список «грязных» прямоугольников —
+        # тогда на экран выводятся только они, без полного flip.
+        dirty = self.draw_callback()
+
+        # Draw debug information
+        if self.show_fps:
+            self._draw_fps()
+
+        # Применяем тряску, если активна
+        if shake_offset != (0.0, 0.0):
+            # Восстанавливаем оригинальный экран
+            self.screen = original_screen
+            # Очищаем экран и рисуем с смещением
+            self.screen.fill((0, 0, 0))  # Чёрный фон для границ при тряске
+            self.screen.blit(temp_surface, (int(shake_offset[0]), int(shake_offset[1])))
+
+        # Обновляем только если инициализировано окно отображения
+        if self._display_ready:
+            if dirty and shake_offset == (0.0, 0.0) and not self.show_fps:
+                # Если грязных областей набралось на весь экран,
+                # полный flip дешевле поштучного обновления.
+                if sum(r.width * r.height for r in dirty) < self.width * self.height:
+                    pygame.display.update(dirty)
+                else:
+                    pygame.display.flip()
+            else:
+                pygame.display.flip()
+
+    def _blit_background(self) -> None:
+        """Очистить экран фоновым изображением."""
+        self.screen.blit(self.background_surface, (0, 0))
+
+    def _fill_background(self) -> None:
+        """Очистить экран заливкой цветом."""
+        self.screen.fill(self.background_color)
+
+    def _tile_background(self) -> None:
+        """Замостить экран фоновой плиткой одним пакетным вызовом."""
+        if _HAS_FBLITS:
+            self.screen.fblits(self._bg_tile_seq)
+        else:
+            self.screen.blits(self._bg_tile_seq, doreturn=False)
+
+    def _center_background(self) -> None:
+        """Залить экран цветом и нарисовать фон по центру."""
+        self.screen.fill(self.background_color)
+        self.screen.blit(self.background_surface, self._bg_pos)
+
+    def _draw_fps(self) -> None:
+        """Отрисовать счётчик FPS.
+
+        Цифры 0–9 и префикс растеризуются один раз; строка собирается
+        из готовых глифов и только при смене целого значения FPS —
+        вместо дорогого font.render каждый кадр.
+        """
+        if not self.font:
+            self.font = pygame.font.Font(None, 36)
+        if self._digit_cache is None:
+            self._fps_prefix = self.font.render("FPS: ", True, (255, 255, 255))
+            self._digit_cache = tuple(
+                self.font.render(str(d), True, (255, 255, 255))
+                for d in range(10)
+            )
+
+        fps_int = int(self.clock.get_fps())
+        if fps_int != self._last_fps_int:
+            self._last_fps_int = fps_int
+            digits = [self._digit_cache[ord(ch) - 48] for ch in str(fps_int)]
+            width = self._fps_prefix.get_width() + sum(
+                d.get_width() for d in digits
+            )
+            surface = pygame.Surface(
+                (width, self._fps_prefix.get_height()), pygame.SRCALPHA
+            )
+            surface.blit(self._fps_prefix, (0, 0))
+            x = self._fps_prefix.get_width()
+            for digit in digits:
+                surface.blit(digit, (x, 0))
+                x += digit.get_width()
+            self._fps_surface = surface
+
+        self.screen.blit(self._fps_surface, (10, 10))
+
+    def add_sprite(self, sprite: pygame.sprite.Sprite) -> None:
+        """
+        Добавить спрайт в систему автоматического обновления и отрисовки.
+
+        Аргументы:
+            sprite: Спрайт, который нужно добавить
+        """
+        self.all_sprites.add(sprite)
+
+    def remove_sprite(self, sprite: pygame.sprite.Sprite) -> None:
+        """
+        Удалить спрайт из системы автоматического управления.
+
+        Аргументы:
+            sprite: Спрайт, который нужно удалить
+        """
+        self.all_sprites.remove(sprite)
+
+    def set_adaptive(self, enabled: bool) -> None:
+        """
+        Включить или выключить адаптивную отрисовку.
+
+        В адаптивном режиме кадр перерисовывается только когда он
+        изменился: спрайты группы сверяются автоматически, а изменения,
+        которые рисует draw-колбэк, нужно помечать вызовом invalidate().
+        На статичных экранах (меню, пауза) это сводит стоимость кадра
+        почти к нулю.
+
+        Аргументы:
+            enabled: True — включить адаптивный режим
+        """
+        self._adaptive = enabled
+        self._dirty = True
+
+    def invalidate(self) -> None:
+        """Пометить кадр изменившимся — следующий _draw перерисует его."""
+        self._dirty = True
+
+    def allow_event(self, event_type: int) -> None:
+        """
+        Разрешить приём событий указанного типа.
+
+        По умолчанию игра пропускает только базовый набор (клавиатура,
+        мышь, QUIT, USEREVENT); остальные типы — например TEXTINPUT —
+        можно включить этим методом.
+
+        Аргументы:
+            event_type: Тип события pygame (например, pygame.TEXTINPUT)
+        """
+        pygame.event.set_allowed(event_type)
+
+    def block_event(self, event_type: int) -> None:
+        """
+        Запретить приём событий указанного типа.
+
+        Аргументы:
+            event_type: Тип события pygame
+        """
+        pygame.event.set_blocked(event_type)
+
+    def add_event_callback(self, callback: Callable) -> None:
+        """
+        Добавить пользовательский обработчик событий.
+
+        Аргументы:
+            callback: Функция, принимающая объект события pygame
+        """
+        self.event_callbacks.append(callback)
+        self._event_callbacks = tuple(self.event_callbacks)
+
+    def set_background_color(self, color: Tuple[int, int, int]) -> None:
+        """
+        Установить цвет фона.
+
+        Аргументы:
+            color: RGB-кортеж цвета (0–255)
+        """
+        self.background_color = color
+        # Если установлен цвет фона, убираем фоновое изображение
+        self.background_surface = None
+        self._draw_background = self._fill_background
+
+    def set_background_image(self, image_path: Optional[str],
+                             background_mode: Optional[str] = None) -> None:
+        """
+        Установить фоновое изображение.
+
+        В режиме scale изображение масштабируется под размеры окна,
+        в режиме tile — замащивает его плиткой, в режиме center —
+        рисуется по центру поверх цветового фона.
+        Передача None отключает фоновое изображение.
+
+        Аргументы:
+            image_path: Путь к файлу изображения или None для отключения
+            background_mode: 'scale', 'tile' или 'center'
+                             (None — оставить текущий режим)
+        """
+        if background_mode is not None:
+            if background_mode not in ("scale", "tile", "center"):
+                raise ValueError(
+                    f"background_mode must be 'scale', 'tile' or 'center', "
+                    f"got {background_mode!r}"
+                )
+            self.background_mode = background_mode
+        if image_path is None:
+            self.background_image_path = None
+            self.background_image = None
+            self.background_surface = None
+            self._bg_tile_seq = None
+            self._draw_background = self._fill_background
+        else:
+            self.background_image_path = image_path
+            self._load_background_image(image_path)
+
+    def has_background_image(self) -> bool:
+        """
+        Проверить, установлено ли фоновое изображение.
+        
+        Возвращает:
+            True, если фоновое изображение загружено и готово к использованию
+        """
+        return self.background_surface is not None
+
+    def set_title(self, title: str) -> None:
+        """
+        Изменить заголовок окна.
+
+        Аргументы:
+            title: Новый заголовок окна
+        """
+        self.title = title
+        pygame.display.set_caption(title)
+
+    def set_fps(self, fps: int) -> None:
+        """
+        Задать целевую частоту кадров.
+
+        Аргументы:
+            fps: Кадров в секунду
+        """
+        self.fps = max(1, fps)
+
+    def toggle_fps_display(self) -> None:
+        """Переключить отображение счётчика FPS."""
+        self.show_fps = not self.show_fps
+
+    def toggle_pause(self) -> None:
+        """Переключить состояние паузы игры."""
+        self.paused = not self.paused
+
+    def pause(self) -> None:
+        """Поставить игру на паузу."""
+        self.paused = True
+
+    def resume(self) -> None:
+        """Возобновить игру."""
+        self.paused = False
+
+    def quit(self) -> None:
+        """
+        Завершить игру и очистить ресурсы.
+        """
+        self.running = False
+        pygame.quit()
+        sys.exit()
+
+    def get_screen_rect(self) -> pygame.Rect:
+        """
+        Получить прямоугольник экрана для проверки границ.
+
+        Возвращает:
+            Объект Rect, представляющий границы экрана
+        """
+        return pygame.Rect(0, 0, self.width, self.height)
+
+    def get_center(self) -> Tuple[int, int]:
+        """
+        Получить центр экрана.
+
+        Возвращает:
+            Координаты центра (x, y)
+        """
+        return (self.width // 2, self.height // 2)
+
+    def is_point_on_screen(self, x: int, y: int) -> bool:
+        """
+        Проверить, находится ли точка внутри границ экрана.
+
+        Аргументы:
+            x: Координата X
+            y: Координата Y
+
+        Возвращает:
+            True — если точка на экране
+        """
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def screenshot(self, filename: str = "screenshot.png") -> None:
+        """
+        Сохранить скриншот текущего экрана.
+
+        Аргументы:
+            filename: Путь к файлу скриншота
+        """
+        pygame.image.save(self.screen, filename)
+
+    def get_keys(self):
+        """
+        Получить снимок состояния клавиатуры за текущий кадр.
+
+        Снимок делается один раз за кадр; сцены читают его вместо
+        собственных вызовов pygame.key.get_pressed().
+
+        Возвращает:
+            Результат pygame.key.get_pressed() текущего кадра
+        """
+        return self._keys
+
+    def get_delta_time(self) -> float:
+        """
+        Получить дельта-время (время с прошлого кадра) в секундах.
+
+        Возвращает:
+            Дельта-время в секундах
+        """
+        return self.dt
+
+    def get_fps(self) -> float:
+        """
+        Получить текущую частоту кадров.
+
+        Возвращает:
+            Текущее значение FPS
+        """
+        return self.clock.get_fps()
+
+    def debug_info(self) -> dict:
+        """
+        Получить отладочную информацию о состоянии игры.
+
+        Возвращает:
+            Словарь с отладочной информацией
+        """
+        return {
+            "fps": self.get_fps(),
+            "dt": self.dt,
+            "running": self.running,
+            "paused": self.paused,
+            "sprite_count": len(self.all_sprites),
+            "screen_size": (self.width, self.height),
+            "background_color": self.background_color,
+            "background_image": self.background_image_path,
+            "has_background_image": self.has_background_image(),
+        }
@@ -2,73 +2,175 @@
 Базовая система физики
 """
 
-from typing import Tuple
+import numpy as np
+from typing import List, Sequence, Tuple
+
+
+def _integrate(vx, vy, ax, ay, on_ground, gravity, friction, air_res, dt):
+    """Скалярный шаг интегрирования одного тела.
+
+    Чистая арифметика без объектов — её компилирует Numba, если та
+    установлена; возвращает (vx, vy, dx, dy).
+    """
+    if not on_ground:
+        ay += gravity
+    vx += ax * dt
+    vy += ay * dt
+    if on_ground:
+        vx *= friction
+    else:
+        vx *= air_res
+        vy *= air_res
+    return vx, vy, vx * dt, vy * dt
+
+
+def _reflect(vx, vy, nx, ny, bounce_factor):
+    """Отразить скорость от поверхности с нормалью (nx, ny)."""
+    dot = vx * nx + vy * ny
+    return ((vx - 2 * dot * nx) * bounce_factor,
+            (vy - 2 * dot * ny) * bounce_factor)
+
+
+# При наличии Numba горячие ядра компилируются в машинный код;
+# без неё остаются обычными функциями Python.
+try:
+    from numba import njit
+    _integrate = njit(cache=True, fastmath=True)(_integrate)
+    _reflect = njit(cache=True, fastmath=True)(_reflect)
+except ImportError:
+    pass
 
 
 class PhysicsBody:
-    """Базовое физическое тело для спрайтов."""
+    """Базовое физическое тело для спрайтов.
+
+    Скорость и ускорение хранятся скалярами vx/vy/ax/ay: это вдвое
+    меньше байткода на каждую осевую операцию, чем индексация списков,
+    и без аллокаций в update. Свойства velocity/acceleration оставлены
+    для совместимости — они возвращают новый список, поэтому менять
+    компоненты нужно через vx/vy/ax/ay, а не через элементы списка.
+
+    Гравитация вкладывается в ay прямо внутри шага интегрирования
+    (а не отдельным методом перед ним): пока тело не на земле, каждый
+    update добавляет к вертикальной скорости gravity * dt.
+    """
 
     def __init__(self, mass: float = 1.0, gravity: float = 400.0):
         self.mass = mass
         self.gravity = gravity
-        self.velocity = [0.0, 0.0]
-        self.acceleration = [0.0, 0.0]
+        self.vx = 0.0
+        self.vy = 0.0
+        self.ax = 0.0
+        self.ay = 0.0
         self.on_ground = False
         self.friction = 0.8
         self.bounce_factor = 0.7  # Коэффициент упругости (0.0 - 1.0)
         self.air_resistance = 0.99  # Сопротивление воздуха
 
-    def apply_force(self, force_x: float, force_y: float) -> None:
-        """Применить силу к телу."""
-        self.acceleration[0] += force_x / self.mass
-        self.acceleration[1] += force_y / self.mass
-
-    def apply_gravity(self, dt: float) -> None:
-        """Применить силу гравитации."""
-        if not self.on_ground:
-            # Гравитация - постоянное ускорение вниз
-            self.acceleration[1] += self.gravity
-
-    def update(self, dt: float) -> Tuple[float, float]:
-        """Обновить физику и вернуть изменение позиции."""
-        # Применяем гравитацию
-        self.apply_gravity(dt)
+    @property
+    def velocity(self) -> List[float]:
+        """Скорость [vx, vy] (копия; писать — в vx/vy)."""
+        return [self.vx, self.vy]
 
-        # Обновляем скорость
-        self.velocity[0] += self.acceleration[0] * dt
-        self.velocity[1] += self.acceleration[1] * dt
+    @velocity.setter
+    def velocity(self, value: Sequence[float]) -> None:
+        self.vx, self.vy = value
 
-        # Применяем сопротивление воздуха
-        if not self.on_ground:
-            self.velocity[0] *= self.air_resistance
-            self.velocity[1] *= self.air_resistance
+    @property
+    def acceleration(self) -> List[float]:
+        """Ускорение [ax, ay] (копия; писать — в ax/ay)."""
+        return [self.ax, self.ay]
 
-        # Применяем трение о землю
-        if self.on_ground:
-            self.velocity[0] *= self.friction
+    @acceleration.setter
+    def acceleration(self, value: Sequence[float]) -> None:
+        self.ax, self.ay = value
 
-        # Вычисляем изменение позиции
-        dx = self.velocity[0] * dt
-        dy = self.velocity[1] * dt
+    def apply_force(self, force_x: float, force_y: float) -> None:
+        """Применить силу к телу."""
+        self.ax += force_x / self.mass
+        self.ay += force_y / self.mass
 
-        # Сбрасываем ускорение
-        self.acceleration = [0.0, 0.0]
+    def update(self, dt: float) -> Tuple[float, float]:
+        """Обновить физику и вернуть изменение позиции."""
+        # Вся арифметика — в вынесенном ядре _integrate (под Numba).
+        vx, vy, dx, dy = _integrate(
+            self.vx, self.vy, self.ax, self.ay,
+            self.on_ground, self.gravity,
+            self.friction, self.air_resistance, dt,
+        )
+        self.vx = vx
+        self.vy = vy
+
+        # Сбрасываем ускорение (без аллокации нового списка)
+        self.ax = 0.0
+        self.ay = 0.0
 
         return dx, dy
 
+    @staticmethod
+    def update_all(bodies: Sequence["PhysicsBody"],
+                   dt: float) -> List[Tuple[float, float]]:
+        """Обновить физику сразу нескольких тел одним векторным проходом.
+
+        Эквивалентно вызову update(dt) для каждого тела, но гравитация,
+        интегрирование и затухание считаются по массивам NumPy в C —
+        при сотне и более тел это на порядок дешевле поштучного цикла.
+
+        Аргументы:
+            bodies: Последовательность тел для обновления
+            dt: Дельта-время в секундах
+
+        Возвращает:
+            Список (dx, dy) — изменение позиции каждого тела
+        """
+        if not bodies:
+            return []
+
+        vel = np.array([(b.vx, b.vy) for b in bodies], dtype=np.float64)
+        acc = np.array([(b.ax, b.ay) for b in bodies], dtype=np.float64)
+        on_ground = np.array([b.on_ground for b in bodies], dtype=bool)
+        in_air = ~on_ground
+
+        acc[:, 1] += np.where(
+            in_air, np.array([b.gravity for b in bodies]), 0.0
+        )
+        vel += acc * dt
+        vel *= np.where(
+            in_air, np.array([b.air_resistance for b in bodies]), 1.0
+        )[:, None]
+        vel[:, 0] *= np.where(
+            on_ground, np.array([b.friction for b in bodies]), 1.0
+        )
+
+        delta = vel * dt
+        for i, body in enumerate(bodies):
+            body.vx = vel[i, 0]
+            body.vy = vel[i, 1]
+            body.ax = 0.0
+            body.ay = 0.0
+        return [(delta[i, 0], delta[i, 1]) for i in range(len(bodies))]
+
     def bounce(self, surface_normal: Tuple[float, float]) -> None:
         """Отскочить от поверхности с заданным нормальным вектором."""
         nx, ny = surface_normal
-        
-        # Отражение скорости от поверхности
-        dot_product = self.velocity[0] * nx + self.velocity[1] * ny
-        
-        self.velocity[0] = self.velocity[0] - 2 * dot_product * nx
-        self.velocity[1] = self.velocity[1] - 2 * dot_product * ny
-        
-        # Применяем коэффициент упругости
-        self.velocity[0] *= self.bounce_factor
-        self.velocity[1] *= self.bounce_factor
+        # Отражение и упругость считает вынесенное ядро _reflect.
+        self.vx, self.vy = _reflect(
+            self.vx, self.vy, nx, ny, self.bounce_factor
+        )
+
+    @staticmethod
+    def bounce_all(vx: np.ndarray, vy: np.ndarray, nx, ny,
+                   bounce_factor) -> None:
+        """Отразить сразу массив скоростей от поверхностей.
+
+        Работает на месте с массивами компонент скорости; нормали и
+        упругость — скаляры или массивы той же длины (broadcasting).
+        Предпочтительный путь для систем частиц и роя тел: та же
+        формула, что в _reflect, но одним векторным проходом.
+        """
+        k = 2.0 * (vx * nx + vy * ny)
+        vx[:] = (vx - k * nx) * bounce_factor
+        vy[:] = (vy - k * ny) * bounce_factor
 
     def set_bounce_factor(self, factor: float) -> None:
         """Задать коэффициент упругости (0.0 = без отскока, 1.0 = идеальный)."""
@@ -9,6 +9,10 @@ from abc import ABC, abstractmethod
 class Scene(ABC):
     """Базовый класс для игровых сцен."""
 
+    # Пустой __dict__ не создаётся: подклассы со своими __slots__
+    # хранят атрибуты компактно и обращаются к ним быстрее.
+    __slots__ = ("name", "active")
+
     def __init__(self, name: str):
         self.name = name
         self.active = False
@@ -33,33 +37,52 @@ class Scene(ABC):
 
 
 class SceneManager:
-    """Управляет несколькими игровыми сценами."""
+    """Управляет несколькими игровыми сценами.
+
+    update и draw — перепривязываемые атрибуты экземпляра: при смене
+    сцены они указывают прямо на методы текущей сцены, поэтому каждый
+    кадр обходится без проверки «есть ли сцена» и лишнего вызова-
+    посредника. Пока сцены нет, стоит заглушка _noop.
+    """
+
+    @staticmethod
+    def _noop(*args, **kwargs) -> None:
+        """Заглушка update/draw, пока сцена не выбрана."""
+        return None
 
     def __init__(self):
         self.scenes: Dict[str, Scene] = {}
+        self.factories: Dict[str, Callable[[], Scene]] = {}
         self.current_scene: Optional[Scene] = None
+        self.update: Callable = self._noop
+        self.draw: Callable = self._noop
 
     def add_scene(self, scene: Scene) -> None:
         """Добавить сцену."""
         self.scenes[scene.name] = scene
 
-    def switch_to(self, scene_name: str) -> bool:
-        """Переключиться на указанную сцену."""
-        if scene_name in self.scenes:
-            if self.current_scene:
-                self.current_scene.on_exit()
+    def register(self, scene_name: str, factory: Callable[[], Scene]) -> None:
+        """Зарегистрировать фабрику: сцена создаётся при первом переходе.
 
-            self.current_scene = self.scenes[scene_name]
-            self.current_scene.on_enter()
-            return True
-        return False
+        Непосещённые сцены не грузят свои ресурсы вовсе.
+        """
+        self.factories[scene_name] = factory
 
-    def update(self, dt: float) -> None:
-        """Обновить текущую сцену."""
-        if self.current_scene:
-            self.current_scene.update(dt)
+    def switch_to(self, scene_name: str) -> bool:
+        """Переключиться на указанную сцену."""
+        scene = self.scenes.get(scene_name)
+        if scene is None:
+            factory = self.factories.get(scene_name)
+            if factory is None:
+                return False
+            scene = self.scenes[scene_name] = factory()
 
-    def draw(self, screen) -> None:
-        """Отрисовать текущую сцену."""
         if self.current_scene:
-            self.current_scene.draw(screen)
+            self.current_scene.on_exit()
+
+        self.current_scene = scene
+        scene.on_enter()
+        # Кадр дальше зовёт методы сцены напрямую, без диспетчера.
+        self.update = scene.update
+        self.draw = scene.draw
+        return True
@@ -4,10 +4,63 @@
 
 import pygame
 import math
+import numpy as np
 from typing import List, Dict, Tuple, Optional, Union
+
+from . import _collision_kernels as _ck
 from pathlib import Path
 from .animation import Animation, AnimationManager
 
+# Кэш декодированных изображений по пути: map.png и другие общие ассеты
+# декодируются один раз на всё приложение, а не в каждой сцене заново.
+_image_cache: Dict[str, pygame.Surface] = {}
+
+
+def load_image(path: Union[str, Path]) -> pygame.Surface:
+    """Загрузить изображение с кэшированием по пути."""
+    key = str(path)
+    surface = _image_cache.get(key)
+    if surface is None:
+        surface = pygame.image.load(key)
+        if pygame.display.get_surface() is not None:
+            # Полупрозрачным картинкам нужен convert_alpha; непрозрачные
+            # (фоны) после простого convert блитятся заметно быстрее.
+            if surface.get_flags() & pygame.SRCALPHA:
+                surface = surface.convert_alpha()
+            else:
+                surface = surface.convert()
+        surface = _image_cache.setdefault(key, surface)
+    return surface
+
+
+def _batch_sat(self_corners: np.ndarray, others: np.ndarray) -> np.ndarray:
+    """SAT одного четырёхугольника (4, 2) против пачки (N, 4, 2).
+
+    Возвращает булеву маску длины N. Все оси обоих многоугольников
+    проверяются широковещательными операциями NumPy — один проход по
+    массивам вместо N вызовов поштучного теста.
+    """
+    a = self_corners
+    b = others
+
+    # Оси self: (4, 2); проекции b на них — (N, 4, 4)
+    edges_a = np.roll(a, -1, axis=0) - a
+    normals_a = np.stack((-edges_a[:, 1], edges_a[:, 0]), axis=1)
+    proj_a = a @ normals_a.T                       # (4 вершины, 4 оси)
+    proj_b = b @ normals_a.T                       # (N, 4, 4)
+    sep_a = ((proj_a.max(axis=0) < proj_b.min(axis=1))
+             | (proj_b.max(axis=1) < proj_a.min(axis=0))).any(axis=1)
+
+    # Оси каждого из b: (N, 4, 2); einsum проецирует без транспонирований
+    edges_b = np.roll(b, -1, axis=1) - b
+    normals_b = np.stack((-edges_b[:, :, 1], edges_b[:, :, 0]), axis=2)
+    proj_bb = np.einsum('nvc,nac->nva', b, normals_b)   # (N, верш., оси)
+    proj_ab = np.einsum('vc,nac->nva', a, normals_b)
+    sep_b = ((proj_ab.max(axis=1) < proj_bb.min(axis=1))
+             | (proj_bb.max(axis=1) < proj_ab.min(axis=1))).any(axis=1)
+
+    return ~(sep_a | sep_b)
+
 
 class AnimatedSprite(pygame.sprite.Sprite):
     """
@@ -37,10 +90,22 @@ class AnimatedSprite(pygame.sprite.Sprite):
     ):
         super().__init__()
 
-        # Основные свойства
-        self.original_image = pygame.image.load(str(image_path)).convert_alpha()
+        # Основные свойства. Позиция — Vector2: обе компоненты
+        # складываются одним C-вызовом вместо поэлементной арифметики.
+        self.original_image = load_image(image_path)
         self.frame_size = frame_size
-        self._position = list(position)
+        self._position = pygame.math.Vector2(position)
+
+        # Если дисплея ещё нет, load_image не смог привести лист к его
+        # формату пикселей — каждый blit платил бы за конвертацию.
+        # Откладываем convert до первого update при живом дисплее.
+        self._image_path = str(image_path)
+        self._pending_convert = pygame.display.get_surface() is None
+        if self._pending_convert:
+            print(
+                f"Warning: sprite '{image_path}' created before display "
+                f"initialization; pixel format will be converted on first update"
+            )
 
         # Вычисляем размеры спрайтшита
         self.sheet_width = self.original_image.get_width()
@@ -49,23 +114,41 @@ class AnimatedSprite(pygame.sprite.Sprite):
         self.frames_per_col = self.sheet_height // frame_size[1]
         self.total_frames = self.frames_per_row * self.frames_per_col
 
-        # Извлекаем все кадры из спрайтшита
+        # Извлекаем все кадры из спрайтшита (неизменяемый кортеж);
+        # длина запоминается для проверок границ в горячих путях
         self.frames = self._extract_frames()
+        self._n_frames = len(self.frames)
 
         # Система анимации
         self.animation_manager = AnimationManager()
-        self.current_frame = 0
 
-        # Свойства трансформации
-        self.rotation = 0.0
-        self.scale = 1.0
-        self.flip_x = False
-        self.flip_y = False
+        # Свойства трансформации. Пишутся через свойства-обёртки,
+        # которые помечают образ «грязным»; здесь инициализируются
+        # подлежащие поля напрямую, минуя сеттеры.
+        self._image_dirty = True
+        self._current_frame = 0
+        self._rotation = 0.0
+        self._scale = 1.0
+        self._flip_x = False
+        self._flip_y = False
         self._mirrored = False
 
-        # Физические свойства
-        self.velocity = [0.0, 0.0]
-        self.acceleration = [0.0, 0.0]
+        # Кэш трансформированных кадров: ключ — (кадр, масштаб,
+        # поворот, отражения). Анимация из N кадров в нескольких
+        # ориентациях прогоняет transform-конвейер один раз на
+        # комбинацию, дальше — выборка из словаря.
+        self._transform_cache = {}
+        self._transform_key = None
+
+        # Кэш углов хитбокса: ключ — все входы _get_corners. Пока
+        # спрайт не двигался и не вращался, повторные SAT-тесты в том
+        # же кадре переиспользуют готовый массив (4, 2).
+        self._corners_cache = None
+        self._corners_key = None
+
+        # Физические свойства (сеттеры приводят любую пару к Vector2)
+        self._velocity = pygame.math.Vector2(0.0, 0.0)
+        self._acceleration = pygame.math.Vector2(0.0, 0.0)
 
         # Инициализируем свойства pygame спрайта
         self.image = self.frames[0] if self.frames else pygame.Surface(frame_size)
@@ -81,25 +164,52 @@ class AnimatedSprite(pygame.sprite.Sprite):
         self.hitbox_shape = "rect"  # "rect" or "circle"
         self.hitbox_radius = None  # для круглых хитбоксов
 
-    def _extract_frames(self) -> List[pygame.Surface]:
-        """Извлечь все отдельные кадры из спрайтшита."""
+    def _extract_frames(self) -> Tuple[pygame.Surface, ...]:
+        """Извлечь все отдельные кадры из спрайтшита.
+
+        Кадры — subsurface-виды в пиксельный буфер листа: ни одной
+        аллокации и ни одного копирования пикселей при загрузке.
+        Формат пикселей (convert/convert_alpha) лист уже получил в
+        load_image, и виды наследуют его. Кадры разделяют память с
+        листом, поэтому менять их поверхности нельзя — при
+        необходимости возьмите frame.copy(). Возвращается кортеж:
+        набор кадров после загрузки не меняется, а кортеж компактнее
+        списка и без запаса под рост.
+        """
         frames = []
         frame_width, frame_height = self.frame_size
+        subsurface = self.original_image.subsurface
 
         for row in range(self.frames_per_col):
+            y = row * frame_height
             for col in range(self.frames_per_row):
-                x = col * frame_width
-                y = row * frame_height
-
-                frame = pygame.Surface(self.frame_size, pygame.SRCALPHA)
-                frame.blit(
-                    self.original_image,
-                    (0, 0),
-                    pygame.Rect(x, y, frame_width, frame_height),
-                )
-                frames.append(frame)
+                frames.append(subsurface(
+                    (col * frame_width, y, frame_width, frame_height)
+                ))
+
+        return tuple(frames)
+
+    def _finish_convert(self) -> None:
+        """Привести лист к формату дисплея, появившегося после загрузки.
 
-        return frames
+        Пересобирает кадры-виды и сбрасывает кэш трансформаций: старые
+        поверхности указывают на лист в формате файла. Конвертированный
+        лист кладётся обратно в общий кэш изображений, чтобы следующие
+        спрайты с тем же путём получили его сразу.
+        """
+        surface = self.original_image
+        if surface.get_flags() & pygame.SRCALPHA:
+            surface = surface.convert_alpha()
+        else:
+            surface = surface.convert()
+        self.original_image = surface
+        _image_cache[self._image_path] = surface
+
+        self.frames = self._extract_frames()
+        self._transform_cache.clear()
+        self._transform_key = None
+        self._image_dirty = True
+        self._pending_convert = False
 
     def add_animation(
         self, name: str, frames: List[int], fps: float = 10, loop: bool = True
@@ -117,12 +227,19 @@ class AnimatedSprite(pygame.sprite.Sprite):
             >>> sprite.add_animation("walk", [0, 1, 2, 3], fps=8)
             >>> sprite.add_animation("jump", [4, 5, 6], fps=12, loop=False)
         """
-        # Проверяем индексы кадров
-        valid_frames = [f for f in frames if 0 <= f < len(self.frames)]
-        if len(valid_frames) != len(frames):
-            invalid = [f for f in frames if f not in valid_frames]
+        # Проверяем индексы кадров одним проходом (без O(N^2) поиска
+        # некорректных индексов по списку корректных)
+        n_frames = self._n_frames
+        valid_frames = []
+        invalid = []
+        for f in frames:
+            if 0 <= f < n_frames:
+                valid_frames.append(f)
+            else:
+                invalid.append(f)
+        if invalid:
             print(
-                f"Warning: Invalid frame indices {invalid} for sprite with {len(self.frames)} frames"
+                f"Warning: Invalid frame indices {invalid} for sprite with {n_frames} frames"
             )
 
         animation = Animation(name, valid_frames, fps, loop)
@@ -178,71 +295,189 @@ class AnimatedSprite(pygame.sprite.Sprite):
         Аргументы:
             dt: Дельта-время в секундах
         """
-        # Обновляем анимацию
-        self.animation_manager.update(dt)
-        current_animation = self.animation_manager.get_current_animation()
+        # Дожидаемся дисплея, если лист загрузился до его создания
+        if self._pending_convert and pygame.display.get_surface() is not None:
+            self._finish_convert()
+
+        # Обновляем анимацию (менеджер выбирается из __dict__ один раз)
+        manager = self.animation_manager
+        manager.update(dt)
+        current_animation = manager.get_current_animation()
 
         if current_animation:
-            frame_index = self.animation_manager.get_current_frame_index()
-            if 0 <= frame_index < len(current_animation.frames):
-                sprite_frame_index = current_animation.frames[frame_index]
-                if 0 <= sprite_frame_index < len(self.frames):
+            frame_index = manager.get_current_frame_index()
+            animation_frames = current_animation.frames
+            if 0 <= frame_index < len(animation_frames):
+                sprite_frame_index = animation_frames[frame_index]
+                if 0 <= sprite_frame_index < self._n_frames:
                     self.current_frame = sprite_frame_index
 
-        # Обновляем физику
-        self.velocity[0] += self.acceleration[0] * dt
-        self.velocity[1] += self.acceleration[1] * dt
+        # Обновляем физику: Vector2 интегрирует обе компоненты одним
+        # C-вызовом на операцию, без поэлементной арифметики в
+        # интерпретаторе
+        velocity = self._velocity
+        velocity += self._acceleration * dt
+        position = self._position
+        position += velocity * dt
+
+        # Обновляем изображение, только если кадр или трансформации
+        # менялись с прошлого раза: у неподвижного NPC кадр сводится к
+        # одному присваиванию центра rect ниже
+        if self._image_dirty:
+            self._update_image()
+
+        # Обновляем позицию rect и rect коллизии из уже посчитанных локалей
+        center_x = int(position.x)
+        center_y = int(position.y)
+        self.rect.center = (center_x, center_y)
+        offset_x, offset_y = self.collision_offset
+        self.collision_rect.center = (center_x + offset_x, center_y + offset_y)
+
+    # Предел кэша трансформаций: хватает на длинные анимации в
+    # нескольких ориентациях, но не даёт плавно вращающемуся спрайту
+    # накопить сотни поверхностей.
+    _TRANSFORM_CACHE_MAX = 64
 
-        self._position[0] += self.velocity[0] * dt
-        self._position[1] += self.velocity[1] * dt
+    def _update_image(self) -> None:
+        """Обновить изображение с учётом текущих трансформаций.
 
-        # Обновляем изображение с текущими трансформациями
-        self._update_image()
+        Результат конвейера scale/flip/rotate кэшируется по ключу
+        (кадр, масштаб, целый градус поворота, отражения): пока ключ
+        не меняется, метод ничего не делает; по известному ключу кадр
+        берётся из кэша без единой трансформации.
+        """
+        self._image_dirty = False
+        if not self.frames:
+            return
 
-        # Обновляем позицию rect
-        self.rect.center = (int(self._position[0]), int(self._position[1]))
+        key = (self.current_frame, round(self.scale, 3),
+               int(self.rotation) % 360,
+               self.flip_x or self._mirrored, self.flip_y)
+        if key == self._transform_key:
+            return
 
-        # Обновляем rect коллизии
-        self.collision_rect.center = (
-            self.rect.centerx + self.collision_offset[0],
-            self.rect.centery + self.collision_offset[1],
-        )
+        cache = self._transform_cache
+        image = cache.get(key)
+        if image is None:
+            # Начинаем с текущего кадра; transform-функции возвращают
+            # новые поверхности, копировать исходник не нужно.
+            image = self.frames[self.current_frame]
+
+            # Применяем масштабирование
+            if self.scale != 1.0:
+                new_size = (
+                    int(image.get_width() * self.scale),
+                    int(image.get_height() * self.scale),
+                )
+                image = pygame.transform.scale(image, new_size)
+
+            # Применяем отражение/зеркалирование
+            flip_x = self.flip_x or self._mirrored
+            if flip_x or self.flip_y:
+                image = pygame.transform.flip(image, flip_x, self.flip_y)
+
+            # Применяем поворот
+            if self.rotation != 0:
+                image = pygame.transform.rotate(image, self.rotation)
+
+            # Вытесняем самый старый ключ (dict хранит порядок вставки)
+            if len(cache) >= self._TRANSFORM_CACHE_MAX:
+                del cache[next(iter(cache))]
+            cache[key] = image
+
+        # Обновляем изображение; rect изменяем на месте, не создавая
+        # новый объект — так кэшированные списки (image, rect) для fblits
+        # остаются валидными между кадрами. Координаты центра установит
+        # вызывающий метод update(), чтобы избежать двойного пересчёта.
+        self._transform_key = key
+        self.image = image
+        self.rect.size = image.get_size()
 
-    def _update_image(self) -> None:
-        """Обновить изображение с учётом текущих трансформаций."""
-        if not self.frames:
-            return
+    # Свойства визуального состояния: сеттер каждого помечает образ
+    # «грязным» только при реальном изменении значения, поэтому update()
+    # вообще не заходит в _update_image, пока спрайт выглядит так же.
 
-        # Начинаем с текущего кадра
-        image = self.frames[self.current_frame].copy()
+    @property
+    def current_frame(self) -> int:
+        """Индекс текущего кадра спрайтшита (чтение/запись)."""
+        return self._current_frame
 
-        # Применяем масштабирование
-        if self.scale != 1.0:
-            new_size = (
-                int(image.get_width() * self.scale),
-                int(image.get_height() * self.scale),
-            )
-            image = pygame.transform.scale(image, new_size)
+    @current_frame.setter
+    def current_frame(self, value: int) -> None:
+        if value != self._current_frame:
+            self._current_frame = value
+            self._image_dirty = True
 
-        # Применяем отражение/зеркалирование
-        flip_x = self.flip_x or self._mirrored
-        if flip_x or self.flip_y:
-            image = pygame.transform.flip(image, flip_x, self.flip_y)
+    @property
+    def rotation(self) -> float:
+        """Угол поворота в градусах (чтение/запись)."""
+        return self._rotation
 
-        # Применяем поворот
-        if self.rotation != 0:
-            image = pygame.transform.rotate(image, self.rotation)
+    @rotation.setter
+    def rotation(self, value: float) -> None:
+        if value != self._rotation:
+            self._rotation = value
+            self._image_dirty = True
 
-        # Обновляем изображение и создаём новый rect.
-        # Координаты центра установит вызывающий метод update(),
-        # чтобы избежать двойного пересчёта за один кадр.
-        self.image = image
-        self.rect = self.image.get_rect()
+    @property
+    def scale(self) -> float:
+        """Масштаб спрайта (чтение/запись)."""
+        return self._scale
+
+    @scale.setter
+    def scale(self, value: float) -> None:
+        if value != self._scale:
+            self._scale = value
+            self._image_dirty = True
+
+    @property
+    def flip_x(self) -> bool:
+        """Отражение по горизонтали (чтение/запись)."""
+        return self._flip_x
+
+    @flip_x.setter
+    def flip_x(self, value: bool) -> None:
+        if value != self._flip_x:
+            self._flip_x = value
+            self._image_dirty = True
+
+    @property
+    def flip_y(self) -> bool:
+        """Отражение по вертикали (чтение/запись)."""
+        return self._flip_y
+
+    @flip_y.setter
+    def flip_y(self, value: bool) -> None:
+        if value != self._flip_y:
+            self._flip_y = value
+            self._image_dirty = True
+
+    # Физические свойства: любое присвоенное значение (список, кортеж,
+    # Vector2) приводится к Vector2, чтобы векторная арифметика в
+    # update() всегда шла C-путём
+
+    @property
+    def velocity(self) -> pygame.math.Vector2:
+        """Скорость спрайта (Vector2, можно менять компоненты на месте)."""
+        return self._velocity
+
+    @velocity.setter
+    def velocity(self, value) -> None:
+        self._velocity = pygame.math.Vector2(value)
+
+    @property
+    def acceleration(self) -> pygame.math.Vector2:
+        """Ускорение спрайта (Vector2, можно менять компоненты на месте)."""
+        return self._acceleration
+
+    @acceleration.setter
+    def acceleration(self, value) -> None:
+        self._acceleration = pygame.math.Vector2(value)
 
     # Методы позиционирования и движения
     def set_position(self, x: float, y: float) -> None:
         """Установить позицию спрайта."""
-        self._position = [float(x), float(y)]
+        self._position.update(float(x), float(y))
 
     def get_position(self) -> Tuple[float, float]:
         """Получить текущую позицию спрайта."""
@@ -255,7 +490,7 @@ class AnimatedSprite(pygame.sprite.Sprite):
 
     @x.setter
     def x(self, value: float) -> None:
-        self._position[0] = float(value)
+        self._position.x = float(value)
         # Синхронизируем rect и collision rect немедленно
         self.rect.centerx = int(value)
         self.collision_rect.centerx = int(value) + self.collision_offset[0]
@@ -267,7 +502,7 @@ class AnimatedSprite(pygame.sprite.Sprite):
 
     @y.setter
     def y(self, value: float) -> None:
-        self._position[1] = float(value)
+        self._position.y = float(value)
         # Синхронизируем rect и collision rect немедленно
         self.rect.centery = int(value)
         self.collision_rect.centery = int(value) + self.collision_offset[1]
@@ -276,23 +511,17 @@ class AnimatedSprite(pygame.sprite.Sprite):
 
     def move(self, dx: float, dy: float) -> None:
         """Переместить спрайт на смещение."""
-        self._position[0] += dx
-        self._position[1] += dy
+        self._position += (dx, dy)
 
     def move_to(self, x: float, y: float, speed: float = None) -> None:
         """Переместить спрайт к заданной позиции."""
         if speed is None:
             self.set_position(x, y)
         else:
-            dx = x - self._position[0]
-            dy = y - self._position[1]
-            distance = math.sqrt(dx**2 + dy**2)
-
-            if distance > 0:
-                dx_norm = dx / distance
-                dy_norm = dy / distance
-                self.velocity[0] = dx_norm * speed
-                self.velocity[1] = dy_norm * speed
+            delta = pygame.math.Vector2(x, y) - self._position
+            # length_squared: нулевой вектор отсекается без sqrt
+            if delta.length_squared() > 0:
+                self._velocity = delta.normalize() * speed
 
     # Методы трансформации
     def set_rotation(self, angle: float) -> None:
@@ -326,9 +555,25 @@ class AnimatedSprite(pygame.sprite.Sprite):
 
     def mirror(self, mirrored: bool = True) -> None:
         """Отразить спрайт по горизонтали (полезно для движения влево/вправо)."""
-        self._mirrored = mirrored
+        if mirrored != self._mirrored:
+            self._mirrored = mirrored
+            self._image_dirty = True
 
     # Методы коллизий
+
+    @property
+    def hitbox_radius(self) -> Optional[float]:
+        """Радиус круглого хитбокса (чтение/запись)."""
+        return self._hitbox_radius
+
+    @hitbox_radius.setter
+    def hitbox_radius(self, value: Optional[float]) -> None:
+        # Квадрат радиуса считается один раз при записи: проверки
+        # коллизий сравнивают квадраты расстояний и не возводят радиус
+        # в квадрат на каждом тесте
+        self._hitbox_radius = value
+        self._hitbox_radius_sq = None if value is None else value * value
+
     def set_collision_rect(
         self, width: int, height: int, offset_x: int = 0, offset_y: int = 0
     ) -> None:
@@ -367,6 +612,18 @@ class AnimatedSprite(pygame.sprite.Sprite):
         if self.hitbox_shape == "circle" or other.hitbox_shape == "circle":
             return self._check_circle_rect_collision(other)
 
+        # Широкая фаза: ограничивающие окружности хитбоксов. Большинство
+        # пар в кадре далеко друг от друга — квадрат расстояния между
+        # центрами отсекает их до восьми осей SAT. Окружность не зависит
+        # от поворота, поэтому проверка безопасна и для custom_hitbox_size.
+        dx = ((int(other._position[0]) + other.collision_offset[0])
+              - (int(self._position[0]) + self.collision_offset[0]))
+        dy = ((int(other._position[1]) + other.collision_offset[1])
+              - (int(self._position[1]) + self.collision_offset[1]))
+        reach = self._bound_radius() + other._bound_radius()
+        if dx * dx + dy * dy > reach * reach:
+            return False
+
         # ВСЕГДА используем ту же коллизию по углам, что показывает debug_draw
         return self._check_precise_rect_collision(other)
 
@@ -379,50 +636,65 @@ class AnimatedSprite(pygame.sprite.Sprite):
         return self._separating_axis_test(corners_a, corners_b)
 
     def _separating_axis_test(self, corners_a, corners_b):
-        """Проверка столкновения многоугольников методом теоремы о разделяющих осях."""
-        # Получаем все рёбра обоих многоугольников
-        all_corners = [corners_a, corners_b]
-
-        for corners in all_corners:
-            for i in range(len(corners)):
-                # Получаем вектор ребра
-                p1 = corners[i]
-                p2 = corners[(i + 1) % len(corners)]
-                edge = (p2[0] - p1[0], p2[1] - p1[1])
-
-                # Получаем перпендикулярный (нормальный) вектор
-                normal = (-edge[1], edge[0])
-
-                # Нормализуем
-                length = math.sqrt(normal[0] ** 2 + normal[1] ** 2)
-                if length == 0:
-                    continue
-                normal = (normal[0] / length, normal[1] / length)
-
-                # Проецируем оба многоугольника на эту ось
-                proj_a = [
-                    corner[0] * normal[0] + corner[1] * normal[1]
-                    for corner in corners_a
-                ]
-                proj_b = [
-                    corner[0] * normal[0] + corner[1] * normal[1]
-                    for corner in corners_b
-                ]
-
-                min_a, max_a = min(proj_a), max(proj_a)
-                min_b, max_b = min(proj_b), max(proj_b)
-
-                # Проверяем разделение
-                if max_a < min_b or max_b < min_a:
-                    return False  # Найдено разделение — коллизии нет
-        return True  # Разделение не найдено — коллизия обнаружена
+        """Проверка столкновения многоугольников методом теоремы о разделяющих осях.
+
+        При установленной Numba работает скомпилированное ядро из
+        _collision_kernels (прогретое при импорте). Иначе все 8 осей
+        считаются одним векторным проходом NumPy: рёбра через roll,
+        проекции — матричным умножением (4, 2) @ (2, 8). Нормали не
+        нормируются — SAT нужен только знак перекрытия, а деление на
+        длину не меняет порядок проекций.
+        """
+        if _ck.HAS_NUMBA:
+            return _ck.sat_overlap(corners_a, corners_b)
+
+        edges = np.vstack((
+            np.roll(corners_a, -1, axis=0) - corners_a,
+            np.roll(corners_b, -1, axis=0) - corners_b,
+        ))
+        normals = np.empty_like(edges)
+        normals[:, 0] = -edges[:, 1]
+        normals[:, 1] = edges[:, 0]
+
+        # Проекции всех углов на все оси сразу: (4 угла, 8 осей)
+        proj_a = corners_a @ normals.T
+        proj_b = corners_b @ normals.T
+
+        # Разделение хотя бы по одной оси — коллизии нет
+        separated = ((proj_a.max(axis=0) < proj_b.min(axis=0))
+                     | (proj_b.max(axis=0) < proj_a.min(axis=0)))
+        return not bool(separated.any())
+
+    def _bound_radius(self) -> float:
+        """Радиус ограничивающей окружности хитбокса (широкая фаза)."""
+        if self.custom_hitbox_size:
+            width, height = self.custom_hitbox_size
+        else:
+            width = self.frame_size[0] * self.scale
+            height = self.frame_size[1] * self.scale
+        return 0.5 * math.hypot(width, height)
 
     def _check_obb_collision(self, other: "AnimatedSprite") -> bool:
         """УСТАРЕЛО: Используйте _check_precise_rect_collision instead."""
         return self._check_precise_rect_collision(other)
 
     def _get_corners(self):
-        """Получить четыре угла хитбокса спрайта — ТОЧНО как в debug_draw."""
+        """Получить четыре угла хитбокса спрайта — ТОЧНО как в debug_draw.
+
+        Результат мемоизируется по всем входам (позиция, поворот,
+        масштаб, смещение и размер хитбокса): позиция сравнивается уже
+        округлённой, поэтому кэш в том числе переживает субпиксельное
+        движение. Массив кэша не изменять — он общий между вызовами.
+        """
+        key = (
+            int(self._position[0]), int(self._position[1]),
+            self.rotation, self.scale,
+            self.collision_offset[0], self.collision_offset[1],
+            self.custom_hitbox_size,
+        )
+        if key == self._corners_key:
+            return self._corners_cache
+
         # Используем пользовательский размер, если задан, иначе размер кадра с масштабом
         if self.custom_hitbox_size:
             width, height = self.custom_hitbox_size
@@ -439,12 +711,12 @@ class AnimatedSprite(pygame.sprite.Sprite):
         half_w = width / 2
         half_h = height / 2
 
-        corners = [
+        corners = np.array((
             (-half_w, -half_h),  # Верхний левый
             (half_w, -half_h),  # Верхний правый
             (half_w, half_h),  # Нижний правый
             (-half_w, half_h),  # Нижний левый
-        ]
+        ), dtype=np.float32)
 
         # Применяем поворот при необходимости
         if self.rotation != 0:
@@ -454,16 +726,18 @@ class AnimatedSprite(pygame.sprite.Sprite):
             cos_a = math.cos(angle_rad)
             sin_a = math.sin(angle_rad)
 
-            rotated_corners = []
-            for x, y in corners:
-                new_x = x * cos_a - y * sin_a
-                new_y = x * sin_a + y * cos_a
-                rotated_corners.append((new_x, new_y))
-            corners = rotated_corners
+            # Матрица поворота справа: new = (x*cos - y*sin, x*sin + y*cos)
+            corners = corners @ np.array(
+                ((cos_a, sin_a), (-sin_a, cos_a)), dtype=np.float32
+            )
 
         # Переводим в мировые координаты
-        world_corners = [(center_x + x, center_y + y) for x, y in corners]
-        return world_corners
+        corners[:, 0] += center_x
+        corners[:, 1] += center_y
+
+        self._corners_key = key
+        self._corners_cache = corners
+        return corners
 
     def _check_circle_collision(self, other: "AnimatedSprite") -> bool:
         """Проверить столкновение двух окружностей."""
@@ -479,9 +753,10 @@ class AnimatedSprite(pygame.sprite.Sprite):
 
         dx = center2[0] - center1[0]
         dy = center2[1] - center1[1]
-        distance = math.sqrt(dx * dx + dy * dy)
 
-        return distance <= (self.hitbox_radius + other.hitbox_radius)
+        # Сравниваем квадраты расстояний — sqrt на горячем пути не нужен
+        reach = self._hitbox_radius + other._hitbox_radius
+        return dx * dx + dy * dy <= reach * reach
         # Используем согласованное позиционирование как в коллизиях
 
     def _check_circle_rect_collision(self, other: "AnimatedSprite") -> bool:
@@ -520,12 +795,12 @@ class AnimatedSprite(pygame.sprite.Sprite):
         closest_x = max(rect_left, min(circle_center[0], rect_right))
         closest_y = max(rect_top, min(circle_center[1], rect_bottom))
 
-        # Вычисляем расстояние от центра окружности до ближайшей точки
+        # Квадрат расстояния от центра окружности до ближайшей точки
+        # против заранее посчитанного квадрата радиуса — без sqrt
         dx = circle_center[0] - closest_x
         dy = circle_center[1] - closest_y
-        distance = math.sqrt(dx * dx + dy * dy)
 
-        return distance <= circle_sprite.hitbox_radius
+        return dx * dx + dy * dy <= circle_sprite._hitbox_radius_sq
         # Используем согласованное позиционирование как в коллизиях
 
     def _check_polygon_circle_collision(
@@ -545,93 +820,96 @@ class AnimatedSprite(pygame.sprite.Sprite):
         if inside:
             return True
 
-        # Проверяем расстояние от центра окружности до каждого ребра многоугольника
+        # Проверяем расстояние от центра окружности до каждого ребра
+        # многоугольника; сравниваем квадраты — без sqrt на каждом ребре
+        radius_sq = circle_sprite._hitbox_radius_sq
+        px, py = circle_center
+        seg_dist2 = _ck.seg_dist2
         for i in range(len(polygon_corners)):
             p1 = polygon_corners[i]
             p2 = polygon_corners[(i + 1) % len(polygon_corners)]
-
-            # Расстояние от центра окружности до отрезка
-            distance = self._point_to_line_distance(circle_center, p1, p2)
-            if distance <= circle_sprite.hitbox_radius:
+            if seg_dist2(px, py, p1[0], p1[1], p2[0], p2[1]) <= radius_sq:
                 return True
 
         return False
 
     def _point_in_polygon(self, point, polygon):
-        """Проверить, находится ли точка внутри многоугольника (алгоритм лучевого броска)."""
-        x, y = point
-        n = len(polygon)
-        inside = False
-
-        p1x, p1y = polygon[0]
-        for i in range(1, n + 1):
-            p2x, p2y = polygon[i % n]
-            if y > min(p1y, p2y):
-                if y <= max(p1y, p2y):
-                    if x <= max(p1x, p2x):
-                        if p1y != p2y:
-                            xinters = (y - p1y) * (p2x - p1x) / (p2y - p1y) + p1x
-                        if p1x == p2x or x <= xinters:
-                            inside = not inside
-            p1x, p1y = p2x, p2y
-
-        return inside
+        """Проверить, находится ли точка внутри многоугольника (алгоритм лучевого броска).
+
+        Сам бросок луча считает ядро из _collision_kernels (под Numba).
+        """
+        polygon = np.ascontiguousarray(polygon, dtype=np.float32)
+        return bool(_ck.point_in_poly(float(point[0]), float(point[1]), polygon))
 
     def _point_to_line_distance(self, point, line_p1, line_p2):
         """Вычислить минимальное расстояние от точки до отрезка."""
-        px, py = point
-        x1, y1 = line_p1
-        x2, y2 = line_p2
-
-        # Вектор от начала линии к концу
-        line_vec = (x2 - x1, y2 - y1)
-        # Вектор от начала линии к точке
-        point_vec = (px - x1, py - y1)
-
-        # Квадрат длины линии
-        line_len_sq = line_vec[0] * line_vec[0] + line_vec[1] * line_vec[1]
-
-        if line_len_sq == 0:
-            # Линия на самом деле является точкой
-            return math.sqrt((px - x1) * (px - x1) + (py - y1) * (py - y1))
-
-        # Проецируем точку на линию
-        dot_product = point_vec[0] * line_vec[0] + point_vec[1] * line_vec[1]
-        t = max(0, min(1, dot_product / line_len_sq))
-
-        # Находим ближайшую точку на отрезке
-        closest_x = x1 + t * line_vec[0]
-        closest_y = y1 + t * line_vec[1]
-
-        # Расстояние от точки до ближайшей точки на линии
-        dx = px - closest_x
-        dy = py - closest_y
-        return math.sqrt(dx * dx + dy * dy)
+        # Квадрат расстояния считает ядро, sqrt остаётся один на вызов.
+        return math.sqrt(_ck.seg_dist2(
+            point[0], point[1],
+            line_p1[0], line_p1[1], line_p2[0], line_p2[1],
+        ))
 
     def collides_with_group(self, group: pygame.sprite.Group) -> List["AnimatedSprite"]:
-        """Проверить столкновение со всеми спрайтами в группе."""
-        collisions = []
-        for sprite in group:
-            if isinstance(sprite, AnimatedSprite) and sprite != self:
+        """Проверить столкновение со всеми спрайтами в группе.
+
+        Прямоугольные хитбоксы проверяются пачкой: углы всех кандидатов
+        собираются в один массив (N, 4, 2), широкая фаза отсекает по
+        AABB, а узкая — один векторный SAT (_batch_sat) вместо N
+        поштучных вызовов collides_with. Окружности идут старым
+        поштучным путём — их в группах единицы.
+        """
+        collisions: List[Tuple[int, "AnimatedSprite"]] = []
+        rect_targets: List[Tuple[int, "AnimatedSprite"]] = []
+        for index, sprite in enumerate(group):
+            if sprite is self or not isinstance(sprite, AnimatedSprite):
+                continue
+            if self.hitbox_shape == "circle" or sprite.hitbox_shape == "circle":
                 if self.collides_with(sprite):
-                    collisions.append(sprite)
-        return collisions
+                    collisions.append((index, sprite))
+            else:
+                rect_targets.append((index, sprite))
+
+        if rect_targets:
+            corners = np.empty((len(rect_targets), 4, 2), dtype=np.float32)
+            for i, (_, sprite) in enumerate(rect_targets):
+                corners[i] = sprite._get_corners()
+            self_corners = self._get_corners()
+
+            # Широкая фаза: AABB по уже посчитанным углам
+            self_min = self_corners.min(axis=0)
+            self_max = self_corners.max(axis=0)
+            others_min = corners.min(axis=1)
+            others_max = corners.max(axis=1)
+            near = np.nonzero(
+                (others_min[:, 0] <= self_max[0])
+                & (others_max[:, 0] >= self_min[0])
+                & (others_min[:, 1] <= self_max[1])
+                & (others_max[:, 1] >= self_min[1])
+            )[0]
+
+            if near.size:
+                mask = _batch_sat(self_corners, corners[near])
+                collisions.extend(rect_targets[i] for i in near[mask])
+
+        # Возвращаем в порядке обхода группы, как раньше
+        collisions.sort(key=lambda pair: pair[0])
+        return [sprite for _, sprite in collisions]
 
     # Утилитарные методы
     def distance_to(self, other: Union["AnimatedSprite", Tuple[float, float]]) -> float:
         """Вычислить расстояние до другого спрайта или точки с учётом согласованных координат."""
         if isinstance(other, AnimatedSprite):
             # Используем согласованное позиционирование как в коллизиях
-            other_pos = (int(other._position[0]), int(other._position[1]))
+            other_pos = (int(other._position.x), int(other._position.y))
         else:
             other_pos = other
 
-        # Используем согласованное позиционирование
-        self_pos = (int(self._position[0]), int(self._position[1]))
-
-        dx = other_pos[0] - self_pos[0]
-        dy = other_pos[1] - self_pos[1]
-        return math.sqrt(dx**2 + dy**2)
+        # Используем согласованное позиционирование; расстояние считает
+        # C-реализация Vector2
+        self_pos = pygame.math.Vector2(
+            int(self._position.x), int(self._position.y)
+        )
+        return self_pos.distance_to(other_pos)
 
     def angle_to(self, other: Union["AnimatedSprite", Tuple[float, float]]) -> float:
         """Вычислить угол до другого спрайта или точки с учётом согласованных координат."""